@@ -4,13 +4,123 @@ Provides 12+ analysis types for offboard, onboard, and EVPN migration modes.
 """
 from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
+from functools import wraps
 from pathlib import Path
 import json
+import mmap
+import os
 import re
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Parse datasets in worker processes only when there is enough work to
+# amortize the process startup and pickling overhead
+_PARALLEL_PARSE_MIN_BYTES = 10_000_000
+
+
+def _read_file_bytes(path: Path) -> bytes:
+    """Read file as raw bytes via memory-mapping (avoids a decoded str copy)."""
+    with open(path, 'rb') as f:
+        if path.stat().st_size == 0:
+            return b''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return bytes(mm)
+
+
+def _decode_bytes(content: bytes, path: Path) -> str:
+    """Decode bytes with encoding fallback (CSV parsing needs text)."""
+    for encoding in ['utf-8', 'latin-1', 'cp1252']:
+        try:
+            return content.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"Cannot decode file: {path}")
+
+
+def _parse_dataset(dataset: Dict[str, Any]) -> Tuple[str, Optional[list]]:
+    """
+    Read and parse a single dataset.
+
+    Top-level (picklable) so it can run in a worker process. Returns a
+    (kind, parsed) tuple: ('aci', objects), ('cmdb', records),
+    ('missing', None) if the file does not exist, or ('skip', None) for
+    unrecognized dataset types.
+    """
+    from . import parsers
+
+    path = Path(dataset['path'])
+    if not path.exists():
+        return ('missing', None)
+
+    content = _read_file_bytes(path)
+
+    if dataset['type'] == 'aci':
+        parsed = parsers.parse_aci(content, dataset['format'])
+        return ('aci', parsed['objects'])
+    elif dataset['type'] == 'cmdb':
+        return ('cmdb', parsers.parse_cmdb_csv(_decode_bytes(content, path)))
+    return ('skip', None)
+
+
+def _cached_analysis(method):
+    """
+    Memoize a zero-argument analysis method on the analyzer instance.
+
+    Several analyses feed off each other (migration flags re-run the VLAN
+    distribution, migration waves re-run the coupling analysis, the
+    visualization re-runs port utilization), so without caching a single
+    dashboard render walks the object list many times over. Results are
+    stored per instance; datasets are immutable once loaded, so entries
+    never need invalidation.
+    """
+    @wraps(method)
+    def wrapper(self):
+        cache = self._analysis_cache
+        if method.__name__ not in cache:
+            cache[method.__name__] = method(self)
+        return cache[method.__name__]
+    return wrapper
+
+
+# Shared analyzer instances keyed by dataset paths + mtimes, so repeated
+# planner/report flows against the same fabric reuse one parsed object set.
+_ANALYZER_CACHE: Dict[tuple, 'ACIAnalyzer'] = {}
+_ANALYZER_CACHE_MAX = 8
+
+
+def get_analyzer(fabric_data: Dict[str, Any]) -> 'ACIAnalyzer':
+    """
+    Return a shared ACIAnalyzer for this fabric's datasets.
+
+    The cache key includes each dataset's path and mtime, so re-uploads
+    invalidate naturally. Fabrics without file-backed datasets always get
+    a fresh instance.
+    """
+    key_parts = []
+    for dataset in fabric_data.get('datasets', []):
+        path = dataset.get('path')
+        if not path:
+            continue
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        key_parts.append((str(path), mtime))
+
+    if not key_parts:
+        return ACIAnalyzer(fabric_data)
+
+    key = tuple(sorted(key_parts))
+    analyzer = _ANALYZER_CACHE.get(key)
+    if analyzer is None:
+        if len(_ANALYZER_CACHE) >= _ANALYZER_CACHE_MAX:
+            _ANALYZER_CACHE.clear()
+        analyzer = ACIAnalyzer(fabric_data)
+        _ANALYZER_CACHE[key] = analyzer
+    return analyzer
+
 
 class ACIAnalyzer:
     """
@@ -32,9 +142,15 @@ class ACIAnalyzer:
         self.fabric_data = fabric_data
         self.datasets = fabric_data.get('datasets', [])
 
-        # Cached parsed data
+        # Cached parsed data. _aci_objects doubles as the loaded flag, so
+        # it stays None until parsing and categorization fully complete;
+        # the lock serializes the first load when analyses run on threads.
         self._aci_objects = None
         self._cmdb_records = None
+        self._load_lock = threading.Lock()
+
+        # Memoized analysis results (see _cached_analysis)
+        self._analysis_cache = {}
 
         # Categorized ACI objects (populated by _categorize_objects)
         self._fexes = []
@@ -55,54 +171,84 @@ class ACIAnalyzer:
         self._epg_by_dn = {}
         self._bd_by_dn = {}
 
+        # Parent-DN indexes built once in _categorize_objects so per-EPG
+        # and per-BD analyses do a dict lookup instead of re-scanning all
+        # path attachments / subnets (O(EPGs x paths) without them)
+        self._paths_by_epg_dn = {}
+        self._subnets_by_bd_dn = {}
+
     def _load_data(self):
         """Load and parse all datasets (ACI and CMDB)."""
         if self._aci_objects is not None:
             return
 
-        self._aci_objects = []
-        self._cmdb_records = []
-
-        from . import parsers
-
+        # Analyses may run concurrently against a shared instance (the
+        # module-level analyzer cache, thread-pooled test dispatch), so
+        # the first caller parses under the lock and everyone else blocks
+        # until the data is fully published.
+        with self._load_lock:
+            if self._aci_objects is not None:
+                return
+
+            aci_objects = []
+            cmdb_records = []
+
+            if len(self.datasets) > 1 and self._datasets_total_bytes() > _PARALLEL_PARSE_MIN_BYTES:
+                # Parsing is CPU-bound and per-dataset independent: fan out to
+                # worker processes to sidestep the GIL on large multi-file fabrics
+                from concurrent.futures import ProcessPoolExecutor
+
+                max_workers = min(os.cpu_count() or 1, len(self.datasets))
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(_parse_dataset, d) for d in self.datasets]
+                    for dataset, future in zip(self.datasets, futures):
+                        try:
+                            self._collect_parsed(dataset, future.result(),
+                                                 aci_objects, cmdb_records)
+                        except Exception as e:
+                            logger.error(f"Error loading dataset {dataset.get('filename')}: {str(e)}")
+            else:
+                for dataset in self.datasets:
+                    try:
+                        self._collect_parsed(dataset, _parse_dataset(dataset),
+                                             aci_objects, cmdb_records)
+                    except Exception as e:
+                        logger.error(f"Error loading dataset {dataset.get('filename')}: {str(e)}")
+
+            # Categorize objects for efficient lookups
+            self._categorize_objects(aci_objects)
+
+            # Publish last: the unlocked fast path above treats a non-None
+            # _aci_objects as "fully loaded"
+            self._cmdb_records = cmdb_records
+            self._aci_objects = aci_objects
+
+    def _datasets_total_bytes(self) -> int:
+        """Total on-disk size of all dataset files (missing files count as 0)."""
+        total = 0
         for dataset in self.datasets:
             try:
-                path = Path(dataset['path'])
-                if not path.exists():
-                    logger.warning(f"Dataset file not found: {path}")
-                    continue
-
-                # Read file with encoding fallback
-                content = self._read_file_safe(path)
-
-                if dataset['type'] == 'aci':
-                    parsed = parsers.parse_aci(content, dataset['format'])
-                    self._aci_objects.extend(parsed['objects'])
-                    logger.info(f"Loaded {len(parsed['objects'])} ACI objects from {dataset['filename']}")
-
-                elif dataset['type'] == 'cmdb':
-                    parsed = parsers.parse_cmdb_csv(content)
-                    self._cmdb_records.extend(parsed)
-                    logger.info(f"Loaded {len(parsed)} CMDB records from {dataset['filename']}")
-
-            except Exception as e:
-                logger.error(f"Error loading dataset {dataset.get('filename')}: {str(e)}")
-
-        # Categorize objects for efficient lookups
-        self._categorize_objects()
-
-    def _read_file_safe(self, path: Path) -> str:
-        """Read file with encoding fallback."""
-        for encoding in ['utf-8', 'latin-1', 'cp1252']:
-            try:
-                return path.read_text(encoding=encoding)
-            except UnicodeDecodeError:
+                total += os.stat(dataset['path']).st_size
+            except (KeyError, OSError):
                 continue
-        raise ValueError(f"Cannot decode file: {path}")
-
-    def _categorize_objects(self):
+        return total
+
+    def _collect_parsed(self, dataset: Dict[str, Any], result: Tuple[str, Optional[list]],
+                        aci_objects: list, cmdb_records: list):
+        """Merge one dataset's parse result into the staging lists."""
+        kind, parsed = result
+        if kind == 'missing':
+            logger.warning(f"Dataset file not found: {dataset.get('path')}")
+        elif kind == 'aci':
+            aci_objects.extend(parsed)
+            logger.info(f"Loaded {len(parsed)} ACI objects from {dataset['filename']}")
+        elif kind == 'cmdb':
+            cmdb_records.extend(parsed)
+            logger.info(f"Loaded {len(parsed)} CMDB records from {dataset['filename']}")
+
+    def _categorize_objects(self, aci_objects):
         """Categorize ACI objects by type for efficient access."""
-        for obj in self._aci_objects:
+        for obj in aci_objects:
             obj_type = obj.get('type')
             attrs = obj.get('attributes', {})
 
@@ -142,9 +288,16 @@ class ACIAnalyzer:
 
             elif obj_type == 'fvRsPathAtt':
                 self._path_attachments.append(attrs)
+                dn = attrs.get('dn', '')
+                # Path DN is the EPG DN plus a /rspathAtt-[...] suffix
+                epg_dn = dn.split('/rspathAtt', 1)[0] if '/rspathAtt' in dn else ''
+                self._paths_by_epg_dn.setdefault(epg_dn, []).append(attrs)
 
             elif obj_type == 'fvSubnet':
                 self._subnets.append(attrs)
+                dn = attrs.get('dn', '')
+                bd_dn = dn.split('/subnet-', 1)[0] if '/subnet-' in dn else ''
+                self._subnets_by_bd_dn.setdefault(bd_dn, []).append(attrs)
 
             elif obj_type == 'ethpmPhysIf':
                 self._interfaces.append(attrs)
@@ -157,6 +310,7 @@ class ACIAnalyzer:
             f"{len(self._epgs)} EPGs, {len(self._bds)} BDs, {len(self._contracts)} contracts"
         )
 
+    @_cached_analysis
     def validate(self) -> List[Dict[str, Any]]:
         """Validate loaded data and return validation results."""
         self._load_data()
@@ -225,6 +379,7 @@ class ACIAnalyzer:
 
         return results
 
+    @_cached_analysis
     def analyze_port_utilization(self) -> List[Dict[str, Any]]:
         """
         Analyze port utilization across all FEX devices.
@@ -288,6 +443,7 @@ class ACIAnalyzer:
 
         return results
 
+    @_cached_analysis
     def analyze_leaf_fex_mapping(self) -> Dict[str, Any]:
         """
         Analyze leaf-to-FEX topology mappings.
@@ -340,6 +496,7 @@ class ACIAnalyzer:
             }
         }
 
+    @_cached_analysis
     def analyze_rack_grouping(self) -> Dict[str, Any]:
         """
         Analyze rack-level grouping using CMDB data.
@@ -421,6 +578,7 @@ class ACIAnalyzer:
             }
         }
 
+    @_cached_analysis
     def analyze_bd_epg_mapping(self) -> Dict[str, Any]:
         """
         Analyze Bridge Domain to EPG relationships.
@@ -445,10 +603,7 @@ class ACIAnalyzer:
             ]
 
             # Find subnets in this BD
-            bd_subnets = [
-                subnet for subnet in self._subnets
-                if bd_dn in subnet.get('dn', '')
-            ]
+            bd_subnets = self._subnets_by_bd_dn.get(bd_dn, [])
 
             mappings.append({
                 'bd_name': bd_name,
@@ -471,6 +626,7 @@ class ACIAnalyzer:
             }
         }
 
+    @_cached_analysis
     def analyze_vlan_distribution(self) -> Dict[str, Any]:
         """
         Analyze VLAN distribution across EPGs and path attachments.
@@ -522,6 +678,7 @@ class ACIAnalyzer:
             }
         }
 
+    @_cached_analysis
     def analyze_epg_complexity(self) -> List[Dict[str, Any]]:
         """
         Calculate EPG complexity scores based on:
@@ -540,7 +697,7 @@ class ACIAnalyzer:
             tenant = self._extract_tenant_from_dn(epg_dn)
 
             # Count path attachments for this EPG
-            paths = [p for p in self._path_attachments if epg_dn in p.get('dn', '')]
+            paths = self._paths_by_epg_dn.get(epg_dn, [])
 
             # Extract unique VLANs
             vlans = set()
@@ -580,6 +737,7 @@ class ACIAnalyzer:
 
         return results
 
+    @_cached_analysis
     def analyze_vpc_symmetry(self) -> Dict[str, Any]:
         """
         Analyze VPC symmetry - check if EPG bindings are symmetric across VPC pairs.
@@ -640,6 +798,7 @@ class ACIAnalyzer:
             }
         }
 
+    @_cached_analysis
     def analyze_pdom(self) -> Dict[str, Any]:
         """Analyze physical domain configurations."""
         self._load_data()
@@ -656,6 +815,7 @@ class ACIAnalyzer:
             'count': len(domains)
         }
 
+    @_cached_analysis
     def analyze_migration_flags(self) -> List[Dict[str, Any]]:
         """
         Identify potential migration issues and flags.
@@ -668,7 +828,7 @@ class ACIAnalyzer:
         # Check for EPGs without path attachments
         unbound_epgs = [
             epg for epg in self._epgs
-            if not any(epg.get('dn', '') in p.get('dn', '') for p in self._path_attachments)
+            if not self._paths_by_epg_dn.get(epg.get('dn', ''))
         ]
 
         if unbound_epgs:
@@ -683,7 +843,7 @@ class ACIAnalyzer:
         # Check for BDs without subnets
         bds_without_subnets = [
             bd for bd in self._bds
-            if not any(bd.get('dn', '') in s.get('dn', '') for s in self._subnets)
+            if not self._subnets_by_bd_dn.get(bd.get('dn', ''))
         ]
 
         if bds_without_subnets:
@@ -727,6 +887,7 @@ class ACIAnalyzer:
 
         return flags
 
+    @_cached_analysis
     def analyze_contract_scope(self) -> List[Dict[str, Any]]:
         """
         Analyze contract scopes (context, tenant, global).
@@ -761,6 +922,7 @@ class ACIAnalyzer:
         """Alias for analyze_vlan_distribution."""
         return self.analyze_vlan_distribution()
 
+    @_cached_analysis
     def analyze_cmdb_correlation(self) -> Dict[str, Any]:
         """
         Correlate ACI device data with CMDB records.
@@ -836,6 +998,7 @@ class ACIAnalyzer:
             }
         }
 
+    @_cached_analysis
     def get_visualization_data(self) -> Dict[str, Any]:
         """
         Get data for topology visualization.
@@ -1021,6 +1184,7 @@ class ACIAnalyzer:
 
     # ==================== Coupling & Migration Analysis ====================
 
+    @_cached_analysis
     def analyze_coupling_issues(self) -> Dict[str, Any]:
         """
         Comprehensive coupling analysis for migration planning.
@@ -1045,8 +1209,7 @@ class ACIAnalyzer:
             epg_name = epg.get("name", "")
 
             # Get path attachments for this EPG
-            epg_paths = [p for p in self._path_attachments
-                        if epg_dn in p.get("dn", "")]
+            epg_paths = self._paths_by_epg_dn.get(epg_dn, [])
 
             if not epg_paths:
                 continue
@@ -1159,6 +1322,7 @@ class ACIAnalyzer:
             "migration_risk_score": self._calculate_migration_risk(coupling_issues)
         }
 
+    @_cached_analysis
     def analyze_migration_waves(self) -> Dict[str, Any]:
         """
         Analyze and group EPGs into migration waves based on coupling.
@@ -1195,7 +1359,7 @@ class ACIAnalyzer:
             tenant = self._extract_tenant_from_dn(epg_dn)
 
             # Get EPG path attachments
-            epg_paths = [p for p in self._path_attachments if epg_dn in p.get("dn", "")]
+            epg_paths = self._paths_by_epg_dn.get(epg_dn, [])
             device_count = len(set(p.get("tDn", "") for p in epg_paths))
 
             # Find coupling issues for this EPG
@@ -1255,6 +1419,7 @@ class ACIAnalyzer:
                                  "wave3_medium_coupling", "wave4_high_coupling"]
         }
 
+    @_cached_analysis
     def analyze_vlan_sharing_detailed(self) -> Dict[str, Any]:
         """
         Detailed VLAN sharing analysis for migration planning.
@@ -1358,6 +1523,7 @@ class ACIAnalyzer:
         }
         return descriptions.get(wave_name, "Unknown wave")
 
+    @_cached_analysis
     def analyze_device_epg_vlan_mapping(self) -> Dict[str, Any]:
         """
         Comprehensive device -> EPG -> VLAN mapping analysis.
@@ -1711,6 +1877,7 @@ class ACIAnalyzer:
     # ==================== Advanced Migration Analysis Methods ====================
     # These methods use the new analysis modules for complete ACI migration
 
+    @_cached_analysis
     def analyze_vpc_configuration(self) -> Dict[str, Any]:
         """
         Analyze VPC and port-channel configurations for migration.
@@ -1728,6 +1895,7 @@ class ACIAnalyzer:
             logger.error(f"VPC analysis failed: {str(e)}")
             return {'error': str(e)}
 
+    @_cached_analysis
     def analyze_contract_to_acl_translation(self) -> Dict[str, Any]:
         """
         Translate ACI contracts to traditional ACLs for non-ACI platforms.
@@ -1744,6 +1912,7 @@ class ACIAnalyzer:
             logger.error(f"Contract translation failed: {str(e)}")
             return {'error': str(e)}
 
+    @_cached_analysis
     def analyze_l3out_connectivity(self) -> Dict[str, Any]:
         """
         Analyze L3Out configurations and external connectivity.
@@ -1761,6 +1930,7 @@ class ACIAnalyzer:
             logger.error(f"L3Out analysis failed: {str(e)}")
             return {'error': str(e)}
 
+    @_cached_analysis
     def analyze_vlan_pools(self) -> Dict[str, Any]:
         """
         Analyze VLAN pool configurations and namespace management.
@@ -1778,6 +1948,7 @@ class ACIAnalyzer:
             logger.error(f"VLAN pool analysis failed: {str(e)}")
             return {'error': str(e)}
 
+    @_cached_analysis
     def analyze_physical_connectivity(self) -> Dict[str, Any]:
         """
         Analyze physical connectivity and interface policies.
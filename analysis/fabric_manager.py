@@ -1,10 +1,36 @@
 """File-Based Fabric Manager with Thread Safety"""
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
+import os
 import threading
+import time
 from datetime import datetime
 
+# orjson serializes/deserializes ~5x faster than stdlib json; fall back
+# silently when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cached ISO timestamp, refreshed at most twice per second. datetime.now()
+# plus isoformat() is surprisingly costly when called per-record in bulk
+# imports, and sub-second precision is not needed for index metadata.
+_last_ts_t = 0.0
+_last_ts = ''
+
+
+def _now_iso() -> str:
+    """Return the current time as an ISO string, cached for ~0.5s."""
+    global _last_ts_t, _last_ts
+    t = time.time()
+    if t - _last_ts_t > 0.5:
+        _last_ts = datetime.fromtimestamp(t).isoformat()
+        _last_ts_t = t
+    return _last_ts
+
 
 class FabricManager:
     """
@@ -18,17 +44,51 @@ class FabricManager:
         self.index_file = self.base_dir / 'index.json'
         self._lock = threading.RLock()  # Reentrant lock for thread safety
 
+        # Active transaction state (see transaction())
+        self._txn_index = None
+        self._txn_dirty = False
+
         # Initialize index file if it doesn't exist
         with self._lock:
             if not self.index_file.exists():
                 self._write_index({})
 
+    @contextmanager
+    def transaction(self):
+        """
+        Batch several index mutations into a single read and write.
+
+        Inside the context, mutations operate on one in-memory copy of the
+        index; the file is rewritten once on exit (and only if something
+        changed). Collapses the O(N) full-file rewrites that bulk
+        operations like repeated add_dataset calls would otherwise do.
+        """
+        with self._lock:
+            if self._txn_index is not None:
+                # Nested transaction: reuse the outer one
+                yield self
+                return
+
+            self._txn_dirty = False
+            self._txn_index = self._read_index()
+            try:
+                yield self
+                if self._txn_dirty:
+                    self._flush_index(self._txn_index)
+            finally:
+                self._txn_index = None
+                self._txn_dirty = False
+
     def _read_index(self) -> Dict[str, Any]:
         """Read index file with thread safety."""
         with self._lock:
+            if self._txn_index is not None:
+                return self._txn_index
             if self.index_file.exists():
                 try:
-                    content = self.index_file.read_text(encoding='utf-8')
+                    content = self.index_file.read_bytes()
+                    if orjson is not None:
+                        return orjson.loads(content)
                     return json.loads(content)
                 except json.JSONDecodeError as e:
                     raise ValueError(f"Corrupted index file: {str(e)}")
@@ -39,16 +99,30 @@ class FabricManager:
     def _write_index(self, index: Dict[str, Any]):
         """
         Write index file atomically with thread safety.
-        Uses temporary file + rename for atomic writes.
+        Inside a transaction, the write is staged and deferred to exit.
         """
+        with self._lock:
+            if self._txn_index is not None:
+                self._txn_index = index
+                self._txn_dirty = True
+                return
+            self._flush_index(index)
+
+    def _flush_index(self, index: Dict[str, Any]):
+        """Write the index to disk atomically via temporary file + rename."""
         with self._lock:
             try:
                 # Write to temporary file first
                 temp_file = self.index_file.with_suffix('.tmp')
-                temp_file.write_text(json.dumps(index, indent=2), encoding='utf-8')
+                if orjson is not None:
+                    data = orjson.dumps(
+                        index, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+                else:
+                    data = json.dumps(index, indent=2, sort_keys=True).encode('utf-8')
+                temp_file.write_bytes(data)
 
                 # Atomic replace (POSIX-compliant)
-                temp_file.replace(self.index_file)
+                os.replace(temp_file, self.index_file)
             except Exception as e:
                 # Clean up temp file on error
                 if temp_file.exists():
@@ -69,13 +143,30 @@ class FabricManager:
                 })
         return sorted(fabrics, key=lambda x: x['modified'], reverse=True)
 
+    def get_fabric(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return one fabric's summary entry, or None if it does not exist.
+
+        Direct index lookup — avoids building (and scanning) the full
+        list_fabrics() result when only one fabric is wanted.
+        """
+        index = self._read_index()
+        data = index.get(name)
+        if data is None or not (self.base_dir / name).exists():
+            return None
+        return {
+            'name': name,
+            'created': data.get('created', ''),
+            'modified': data.get('modified', ''),
+            'dataset_count': len(data.get('datasets', [])),
+        }
+
     def create_fabric(self, name: str):
         index = self._read_index()
         if name in index:
             raise ValueError(f"Fabric '{name}' already exists")
         fabric_dir = self.base_dir / name
         fabric_dir.mkdir(exist_ok=True)
-        now = datetime.now().isoformat()
+        now = _now_iso()
         index[name] = {'created': now, 'modified': now, 'datasets': []}
         self._write_index(index)
 
@@ -101,5 +192,5 @@ class FabricManager:
         if fabric_name not in index:
             raise ValueError(f"Fabric '{fabric_name}' not found")
         index[fabric_name]['datasets'].append(dataset)
-        index[fabric_name]['modified'] = datetime.now().isoformat()
+        index[fabric_name]['modified'] = _now_iso()
         self._write_index(index)
@@ -2,9 +2,22 @@
 import json
 import csv
 import re
+import sys
 from io import StringIO
 from typing import Dict, List, Any
 
+# Prefer C-accelerated JSON parsers when available (simdjson -> orjson -> stdlib).
+# The chosen loader is bound once at import time so the hot path has no per-call branch.
+try:
+    import simdjson
+    _loads = simdjson.loads
+except ImportError:
+    try:
+        import orjson
+        _loads = orjson.loads
+    except ImportError:
+        _loads = json.loads
+
 # Use defusedxml to prevent XXE attacks
 try:
     import defusedxml.ElementTree as ET
@@ -29,28 +42,46 @@ def parse_aci(content: str, file_format: str) -> Dict[str, Any]:
 def parse_aci_json(content: str) -> Dict[str, Any]:
     """Parse ACI JSON export with error handling."""
     try:
-        data = json.loads(content)
+        data = _loads(content)
     except json.JSONDecodeError as e:
         raise ValueError(
             f"Invalid JSON format at line {e.lineno}, column {e.colno}: {e.msg}"
         )
+    except ValueError as e:
+        # Accelerated parsers may raise plain ValueError without position info
+        raise ValueError(f"Invalid JSON format: {str(e)}")
 
-    objects = []
-    if 'imdata' in data:
-        for item in data['imdata']:
-            for obj_type, obj_data in item.items():
-                attributes = obj_data.get('attributes', {})
-                objects.append({
-                    'type': obj_type,
-                    'attributes': attributes,
-                    'dn': attributes.get('dn', ''),
-                })
+    objects = list(iter_aci_objects(data))
 
     if not objects:
         raise ValueError("No valid ACI objects found in JSON file. Expected 'imdata' array.")
 
     return {'format': 'aci_json', 'objects': objects, 'count': len(objects)}
 
+def iter_aci_objects(data: Dict[str, Any]):
+    """
+    Lazily yield normalized objects from a decoded ACI export.
+
+    Streaming consumers can iterate without materializing the full object
+    list, which keeps peak memory bounded for very large APIC exports.
+    """
+    # Valid JSON is not necessarily an ACI export: a non-dict top level
+    # (list, string, number) has no 'imdata' wrapper, so yield nothing and
+    # let parse_aci_json raise its usual "No valid ACI objects" ValueError
+    if not isinstance(data, dict):
+        return
+    for item in data.get('imdata', ()):
+        for obj_type, obj_data in item.items():
+            attributes = obj_data.get('attributes', {})
+            # Class names and attribute keys repeat across tens of
+            # thousands of objects; interning collapses the duplicates to
+            # shared string objects and speeds up later dict lookups
+            yield {
+                'type': sys.intern(obj_type),
+                'attributes': {sys.intern(k): v for k, v in attributes.items()},
+                'dn': attributes.get('dn', ''),
+            }
+
 def parse_aci_xml(content: str) -> Dict[str, Any]:
     """Parse ACI XML export with security and error handling."""
     try:
@@ -63,9 +94,9 @@ def parse_aci_xml(content: str) -> Dict[str, Any]:
     objects = []
     for child in root:
         obj_type = child.tag
-        attributes = dict(child.attrib)
+        attributes = {sys.intern(k): v for k, v in child.attrib.items()}
         objects.append({
-            'type': obj_type,
+            'type': sys.intern(obj_type),
             'attributes': attributes,
             'dn': attributes.get('dn', ''),
         })
@@ -75,15 +106,55 @@ def parse_aci_xml(content: str) -> Dict[str, Any]:
 
     return {'format': 'aci_xml', 'objects': objects, 'count': len(objects)}
 
+# Single combined pattern so the whole config is scanned once instead of
+# running one regex per keyword over every line
+_LEGACY_CONFIG_RE = re.compile(
+    r'^\s*(?:'
+    r'interface\s+(?P<interface>\S+)'
+    r'|vlan\s+(?P<vlans>[\d,\-]+)\s*$'
+    r'|vpc\s+domain\s+(?P<vpc_domain>\d+)'
+    r'|vpc\s+(?P<vpc>\d+)'
+    r')',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Case-insensitive search avoids allocating a lowercased copy of the
+# whole config; the token can appear anywhere (e.g. a 'boot nxos' line),
+# so the full content is scanned
+_NXOS_RE = re.compile(r'nxos', re.IGNORECASE)
+
 def parse_legacy_config(content: str) -> Dict[str, Any]:
-    lines = content.splitlines()
-    platform = 'nxos' if 'nxos' in content.lower() else 'ios'
+    """Parse legacy NX-OS/IOS config for interfaces, VLANs, port-channels, and VPCs."""
+    platform = 'nxos' if _NXOS_RE.search(content) else 'ios'
+
+    interfaces = []
+    vlans = []
+    port_channels = []
+    vpcs = []
+
+    for match in _LEGACY_CONFIG_RE.finditer(content):
+        interface = match.group('interface')
+        if interface:
+            interfaces.append(interface)
+            if interface.lower().startswith('port-channel'):
+                port_channels.append(interface)
+            continue
+
+        vlan_spec = match.group('vlans')
+        if vlan_spec:
+            vlans.extend(extract_vlan_list(f'vlan {vlan_spec}'))
+            continue
+
+        vpc_id = match.group('vpc_domain') or match.group('vpc')
+        if vpc_id:
+            vpcs.append(int(vpc_id))
+
     return {
         'platform': platform,
-        'interfaces': [],
-        'vlans': [],
-        'port_channels': [],
-        'vpcs': [],
+        'interfaces': interfaces,
+        'vlans': vlans,
+        'port_channels': port_channels,
+        'vpcs': vpcs,
     }
 
 def parse_cmdb_csv(content: str) -> List[Dict[str, Any]]:
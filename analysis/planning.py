@@ -1,12 +1,14 @@
 """Planning Module"""
 from typing import Dict, List, Any
-from .engine import ACIAnalyzer
+from .engine import get_analyzer
 
 class ACIPlanner:
     def __init__(self, fabric_data: Dict[str, Any], mode: str):
         self.fabric_data = fabric_data
         self.mode = mode
-        self.analyzer = ACIAnalyzer(fabric_data)
+        # Shared instance: avoids re-parsing datasets when planner and
+        # report flows run against the same fabric
+        self.analyzer = get_analyzer(fabric_data)
 
     def generate_plan(self) -> Dict[str, Any]:
         if self.mode == 'offboard':
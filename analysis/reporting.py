@@ -1,10 +1,28 @@
 """Reporting Module"""
-from typing import Dict, Any
+import csv
+import io
+import time
+from typing import Dict, Any, Optional, TextIO
 from datetime import datetime
 
+# Cached report timestamp, refreshed at most twice per second; strftime
+# is expensive when reports are generated in tight loops
+_last_ts_t = 0.0
+_last_ts = ''
+
+
+def _now_str() -> str:
+    """Return the current time formatted for reports, cached for ~0.5s."""
+    global _last_ts_t, _last_ts
+    t = time.time()
+    if t - _last_ts_t > 0.5:
+        _last_ts = datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M:%S')
+        _last_ts_t = t
+    return _last_ts
+
 def generate_report(fabric_data: Dict[str, Any], mode: str) -> Dict[str, Any]:
     return {
-        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'generated': _now_str(),
         'summary_stats': [],
         'executive_summary': '',
         'opportunities': [],
@@ -13,13 +31,47 @@ def generate_report(fabric_data: Dict[str, Any], mode: str) -> Dict[str, Any]:
         'recommendations': [],
     }
 
-def generate_markdown_report(fabric_data: Dict[str, Any], mode: str) -> str:
+def generate_markdown_report(fabric_data: Dict[str, Any], mode: str,
+                             out: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Generate a Markdown report.
+
+    When ``out`` is given, sections are written to it incrementally so
+    large reports never materialize as one string; otherwise the full
+    report is returned as a string for legacy callers.
+    """
+    if out is None:
+        buf = io.StringIO()
+        generate_markdown_report(fabric_data, mode, out=buf)
+        return buf.getvalue()
+
     report = generate_report(fabric_data, mode)
-    return f"# ACI {mode.title()} Analysis Report\n\nGenerated: {report['generated']}"
+    out.write(f"# ACI {mode.title()} Analysis Report\n\n")
+    out.write(f"Generated: {report['generated']}")
+    return None
+
+def generate_csv_report(fabric_data: Dict[str, Any], mode: str,
+                        out: Optional[TextIO] = None) -> Optional[str]:
+    """Generate a CSV report, streaming rows to ``out`` when given."""
+    if out is None:
+        buf = io.StringIO()
+        generate_csv_report(fabric_data, mode, out=buf)
+        return buf.getvalue()
+
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(['item', 'status'])
+    return None
 
-def generate_csv_report(fabric_data: Dict[str, Any], mode: str) -> str:
-    return "item,status\n"
+def generate_html_report(fabric_data: Dict[str, Any], mode: str,
+                         out: Optional[TextIO] = None) -> Optional[str]:
+    """Generate an HTML report, streaming fragments to ``out`` when given."""
+    if out is None:
+        buf = io.StringIO()
+        generate_html_report(fabric_data, mode, out=buf)
+        return buf.getvalue()
 
-def generate_html_report(fabric_data: Dict[str, Any], mode: str) -> str:
     report = generate_report(fabric_data, mode)
-    return f"<html><body><h1>ACI Report</h1><p>Generated: {report['generated']}</p></body></html>"
+    out.write("<html><body><h1>ACI Report</h1>")
+    out.write(f"<p>Generated: {report['generated']}</p>")
+    out.write("</body></html>")
+    return None
@@ -0,0 +1,51 @@
+"""Shared state for the script-style test suite.
+
+The test scripts double as CLI tools (``python test_x.py``) and as a
+pytest suite, so the shared objects live behind memoized accessors
+rather than fixture arguments — both entry points get the same
+FabricManager and analyzer instances, and the multi-MB sample JSON is
+parsed once per process however the suite is invoked.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def get_fabric_manager():
+    """Return the one FabricManager over the shared fabrics/ directory."""
+    from analysis.fabric_manager import FabricManager
+    return FabricManager(Path('fabrics'))
+
+
+@lru_cache(maxsize=None)
+def get_analyzer(fabric_name):
+    """Return a shared analyzer for the named fabric.
+
+    Delegates to engine.get_analyzer, so the instance is also shared
+    with any application code that loads the same datasets.
+    """
+    from analysis import engine
+    fabric_data = get_fabric_manager().get_fabric_data(fabric_name)
+    return engine.get_analyzer(fabric_data)
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    """Return one shared Flask test client, configured for testing."""
+    from app import app
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    return app.test_client()
+
+
+@lru_cache(maxsize=64)
+def cached_get(url):
+    """Memoized GET for idempotent routes.
+
+    Pages like /visualize are requested by several test scripts; caching
+    by URL renders each of them once per process. Only safe for routes
+    that neither mutate nor depend on per-request session state —
+    anything else goes through get_client() directly.
+    """
+    return get_client().get(url, follow_redirects=False)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Run the script-style test suite with one process per test file.
+
+The four scripts are independent entry points that CI used to invoke
+serially; launching each in its own process sidesteps the GIL and
+collapses total wall time towards the slowest single script.
+"""
+
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+TESTS = (
+    'test_coupling_analysis.py',
+    'test_dashboard_integration.py',
+    'test_dashboards.py',
+    'test_routes.py',
+)
+
+
+def run_test(script):
+    """Run one test script; returns (script, returncode, combined output)."""
+    proc = subprocess.run([sys.executable, script],
+                          capture_output=True, text=True)
+    return script, proc.returncode, proc.stdout + proc.stderr
+
+
+def main():
+    failed = []
+    with ProcessPoolExecutor(max_workers=len(TESTS)) as pool:
+        # map() yields in TESTS order, so each script's output is printed
+        # as one contiguous block even though the runs overlap
+        for script, returncode, output in pool.map(run_test, TESTS):
+            print('=' * 70)
+            print(f'{script} (exit {returncode})')
+            print('=' * 70)
+            print(output)
+            if returncode != 0:
+                failed.append(script)
+
+    if failed:
+        print('FAILED: ' + ', '.join(failed))
+        return 1
+    print(f'All {len(TESTS)} test scripts passed')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
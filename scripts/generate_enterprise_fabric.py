@@ -11,12 +11,35 @@ Features:
 - CMDB correlation data
 """
 
+import argparse
+import itertools
 import json
+import os
 import random
+import sys
 import csv
+import numpy as np
+from collections import Counter, defaultdict
+from multiprocessing import Pool
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Set
+
+# Prefer orjson for serialization speed; fall back to compact stdlib json
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
 
 # Configuration
 CONFIG = {
@@ -61,14 +84,192 @@ CONFIG = {
 }
 
 
+# Attribute values repeated across thousands of records: intern once so
+# every dict shares a single string object per constant
+_YES = sys.intern('yes')
+_ENFORCED = sys.intern('enforced')
+_EXCLUDE = sys.intern('exclude')
+_REGULAR = sys.intern('regular')
+_IMMEDIATE = sys.intern('immediate')
+_PUBLIC = sys.intern('public')
+_ACTIVE = sys.intern('Active')
+
+
+# Interface records differ only in a handful of fields; formatting one
+# template per port skips ~48 nested-dict allocations per FEX
+_IFACE_TEMPLATE = (
+    '{{"ethpmPhysIf":{{"attributes":{{'
+    '"dn":"{prefix}/phys-[eth1/{port}]/phys",'
+    '"operSt":"{status}","usage":"{usage}","portCap":"1G"}}}}}}'
+)
+
+
+def _gen_tenant_epgs(tenant_config, tenant_bds, fexes, leafs, data_centers,
+                     patterns, shared_vlan_prob, vlan_slice, epg_id_start, seed):
+    """
+    Generate one tenant's EPGs and path attachments.
+
+    Top-level (picklable) so tenants can run in parallel worker
+    processes — each tenant independently picks BDs, patterns, and VLANs
+    from its own pool slice. Returns (epgs, imdata_chunk, used_vlans,
+    coupling_stats) for the parent to merge.
+    """
+    rng = random.Random(seed)
+    vlan_iter = itertools.cycle(vlan_slice)
+
+    tenant_name = tenant_config['name']
+    app_count = tenant_config['app_profiles']
+    epgs_per_app = tenant_config['epg_count'] // app_count
+    total_epgs = app_count * epgs_per_app
+
+    # Batched draws, one sequence per decision point
+    pattern_batch = iter(rng.choices(
+        list(patterns), weights=list(patterns.values()), k=total_epgs))
+    fex_picks = iter(rng.choices(fexes, k=total_epgs))
+    leaf_picks = iter(rng.choices(leafs, k=total_epgs))
+
+    epgs = []
+    imdata = []
+    # Per-device VLAN usage, kept as set + parallel list: the set gives
+    # O(1) dedup on insert, the list O(1) random picks without the
+    # list(set) materialization on every shared-VLAN draw
+    used_vlans = defaultdict(lambda: {'set': set(), 'list': []})
+    stats = {
+        'fex_only': 0,
+        'leaf_only': 0,
+        'fex_and_leaf': 0,
+        'multi_fex': 0,
+        'shared_vlans': 0
+    }
+
+    epg_id = epg_id_start
+    for app_idx in range(app_count):
+        app_name = f'{tenant_name}_APP{app_idx+1}'
+
+        for epg_idx in range(epgs_per_app):
+            epg_name = f'EPG{epg_id:04d}_{app_name}'
+            bd = rng.choice(tenant_bds)
+
+            # Determine deployment pattern
+            pattern = next(pattern_batch)
+            stats[pattern] += 1
+
+            # Generate VLAN and device assignments based on pattern
+            vlans = []
+            devices = []
+
+            if pattern == 'fex_only':
+                # Single FEX
+                fex = next(fex_picks)
+                vlans.append(next(vlan_iter))
+                devices.append(('fex', fex['id'], fex['leaf_id']))
+
+            elif pattern == 'leaf_only':
+                # Single leaf
+                leaf = next(leaf_picks)
+                vlans.append(next(vlan_iter))
+                devices.append(('leaf', leaf['id']))
+
+            elif pattern == 'fex_and_leaf':
+                # Both FEX and leaf (coupling!)
+                fex = next(fex_picks)
+                vlan = next(vlan_iter)
+                vlans.extend([vlan, vlan])  # Same VLAN on both
+                devices.extend([('fex', fex['id'], fex['leaf_id']),
+                                ('leaf', fex['leaf_id'])])
+
+            elif pattern == 'multi_fex':
+                # Multiple FEX (high coupling!)
+                fex_count = rng.randint(2, 4)
+                # Try to get FEX from same DC for realism
+                dc = rng.choice(data_centers)
+                dc_fexes = [f for f in fexes if f['dc'] == dc]
+                if len(dc_fexes) < fex_count:
+                    dc_fexes = fexes
+
+                selected_fexes = rng.sample(dc_fexes, min(fex_count, len(dc_fexes)))
+                vlan = next(vlan_iter)
+                for fex in selected_fexes:
+                    vlans.append(vlan)  # Same VLAN across all FEX
+                    devices.append(('fex', fex['id'], fex['leaf_id']))
+
+            # Check for VLAN sharing (coupling scenario)
+            if rng.random() < shared_vlan_prob:
+                # Reuse an existing VLAN from same device
+                device_id = devices[0] if devices else None
+                if device_id and device_id in used_vlans and used_vlans[device_id]['list']:
+                    vlans[0] = rng.choice(used_vlans[device_id]['list'])
+                    stats['shared_vlans'] += 1
+
+            # Track VLAN usage
+            for device_id, vlan in zip(devices, vlans):
+                usage = used_vlans[device_id]
+                if vlan not in usage['set']:
+                    usage['set'].add(vlan)
+                    usage['list'].append(vlan)
+
+            # Create EPG
+            imdata.append({
+                'fvAEPg': {
+                    'attributes': {
+                        'dn': f'uni/tn-{tenant_name}/ap-{app_name}/epg-{epg_name}',
+                        'name': epg_name,
+                        'descr': f'{pattern} deployment',
+                        'pcEnfPref': _ENFORCED,
+                        'prefGrMemb': _EXCLUDE
+                    }
+                }
+            })
+
+            epgs.append({
+                'tenant': tenant_name,
+                'app': app_name,
+                'name': epg_name,
+                'bd': bd['name'],
+                'pattern': pattern,
+                'vlans': vlans,
+                'devices': devices
+            })
+
+            # Generate path attachments; device tuples carry the leaf id,
+            # so no string parsing or FEX lookup is needed
+            for device, vlan in zip(devices, vlans):
+                if device[0] == 'fex':
+                    _, fex_id, leaf_id = device
+                    path_dn = f'topology/pod-1/paths-{leaf_id}/pathep-[eth{fex_id}/1/1]'
+                else:  # leaf
+                    path_dn = f'topology/pod-1/paths-{device[1]}/pathep-[eth1/1]'
+
+                imdata.append({
+                    'fvRsPathAtt': {
+                        'attributes': {
+                            'dn': f'uni/tn-{tenant_name}/ap-{app_name}/epg-{epg_name}/rspathAtt-[{path_dn}]',
+                            'tDn': path_dn,
+                            'encap': f'vlan-{vlan}',
+                            'mode': _REGULAR,
+                            'instrImedcy': _IMMEDIATE
+                        }
+                    }
+                })
+
+            epg_id += 1
+
+    # Hand plain sets back to the parent merge
+    return epgs, imdata, {d: u['set'] for d, u in used_vlans.items()}, stats
+
+
 class EnterpriseFabricGenerator:
     """Generate enterprise-scale ACI fabric data with realistic coupling scenarios."""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.imdata = []
         self.cmdb_records = []
 
+        # Streaming output state (see generate_to_file)
+        self._out = None
+        self._pretty = False
+        self.object_count = 0
+
         # Tracking structures
         self.leafs = []
         self.fexes = []
@@ -78,24 +279,59 @@ class EnterpriseFabricGenerator:
         self.epgs = []
         self.contracts = []
         self.used_vlans = {}  # Track VLAN usage per device
-        self.vlan_pool = list(range(*config['vlan_range']))
-        random.shuffle(self.vlan_pool)
-        self.vlan_idx = 0
-
-    def generate(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
-        """Generate complete fabric data."""
+        # Instance-level RNGs: the plain one skips the module-proxy
+        # indirection of the global random functions, the NumPy one
+        # serves the vectorized draws, and seeding both makes runs
+        # reproducible (worker processes already seed their own from
+        # this base)
+        self.rng = random.Random(42)
+        self.np_rng = np.random.default_rng(42)
+        # C-speed shuffle of the VLAN pool, sharded per tenant worker
+        self.vlan_pool = self.np_rng.permutation(
+            np.arange(config['vlan_range'][0], config['vlan_range'][1]))
+
+    def generate_to_file(self, aci_file: Path, pretty: bool = False) -> List[Dict[str, Any]]:
+        """
+        Generate complete fabric data, streaming ACI records to disk.
+
+        Each phase's records are serialized and written as soon as the
+        phase completes, so no full imdata list is ever held in memory.
+        Returns the CMDB records for the caller to write.
+        """
         print("Generating Enterprise-Scale ACI Fabric Data...")
         print("=" * 70)
 
-        self._generate_topology()
-        self._generate_tenants()
-        self._generate_epgs_with_coupling()
-        self._generate_contracts()
-        self._generate_cmdb()
+        self._pretty = pretty
+        with open(aci_file, 'wb', buffering=1 << 20) as out:
+            self._out = out
+            out.write(b'{"imdata":[')
+            self._generate_topology()
+            self._generate_tenants()
+            self._generate_epgs_with_coupling()
+            self._generate_contracts()
+            out.write(b']}')
+            self._out = None
 
+        self._generate_cmdb()
         self._print_statistics()
 
-        return {'imdata': self.imdata}, self.cmdb_records
+        return self.cmdb_records
+
+    def _emit_chunk(self, chunk: List[Any]):
+        """Serialize and write one phase's records to the output file."""
+        out = self._out
+        for obj in chunk:
+            if self.object_count:
+                out.write(b',')
+            self.object_count += 1
+            if self._pretty:
+                # Cold path: re-inflate pre-serialized records so the
+                # whole file is consistently indented
+                if isinstance(obj, bytes):
+                    obj = json.loads(obj)
+                out.write(_dumps_pretty(obj))
+            else:
+                out.write(obj if isinstance(obj, bytes) else _dumps(obj))
 
     def _generate_topology(self):
         """Generate leaf and FEX topology."""
@@ -104,49 +340,81 @@ class EnterpriseFabricGenerator:
         data_centers = self.config['data_centers']
         leafs_per_dc = self.config['leaf_count'] // len(data_centers)
 
+        # Batch the per-device random draws: one vectorized call apiece
+        # instead of one Python-level RNG call per leaf/FEX
+        leaf_total = leafs_per_dc * len(data_centers)
+        low, high = self.config['fex_per_leaf_range']
+        fex_counts = self.np_rng.integers(low, high + 1, size=leaf_total)
+        fex_total = int(fex_counts.sum())
+        fex_utils = iter(self.np_rng.uniform(0.10, 0.70, size=fex_total))
+        fex_counts = iter(fex_counts)
+
+        # Batched model selection: one random.choices call per model list
+        # instead of one random.choice per device
+        leaf_models = iter(self.rng.choices(self.config['leaf_models'], k=leaf_total))
+        fex_models = iter(self.rng.choices(self.config['fex_models'], k=fex_total))
+
+        # Management addresses derive arithmetically from the leaf id;
+        # compute all octets in vectorized form rather than re-doing the
+        # divmod chain inside the per-leaf loop
+        leaf_ids = np.arange(101, 101 + leaf_total)
+        addr_a = ((leaf_ids // 256) % 256).tolist()
+        addr_b = (leaf_ids % 256).tolist()
+        addresses = iter(f'10.{a}.{b}.{b}' for a, b in zip(addr_a, addr_b))
+
+        # Operational status draws in two vectorized calls; the old
+        # random.choice(['up']*95 + ['down']*5) built a fresh 100-element
+        # list for every single device
+        leaf_oper = iter(np.where(self.np_rng.random(leaf_total) < 0.95, 'up', 'down').tolist())
+        fex_oper = iter(np.where(self.np_rng.random(fex_total) < 0.90, 'up', 'down').tolist())
+
         leaf_id = 101
         fex_id = 101
 
+        # Build the phase locally and merge with one extend: cheaper than
+        # interleaving tens of thousands of appends on the shared list
+        chunk = []
+
         for dc in data_centers:
             for i in range(leafs_per_dc):
-                # Create leaf
-                leaf_model = random.choice(self.config['leaf_models'])
-                leaf = {
-                    'fabricNode': {
-                        'attributes': {
-                            'dn': f'topology/pod-1/node-{leaf_id}',
-                            'id': str(leaf_id),
-                            'name': f'leaf-{dc}-{i+1:03d}',
-                            'role': 'leaf',
-                            'model': leaf_model['model'],
-                            'serial': f'LEAF{leaf_id:05d}SN',
-                            'address': f'10.{(leaf_id // 256) % 256}.{leaf_id % 256}.{leaf_id % 256}',
-                            'fabricSt': 'active',
-                            'operSt': random.choice(['up'] * 95 + ['down'] * 5)  # 95% uptime
-                        }
-                    }
-                }
-                self.imdata.append(leaf)
-                self.leafs.append({'id': leaf_id, 'name': leaf['fabricNode']['attributes']['name'],
+                # Create leaf, serialized straight to its JSON form: the
+                # record is write-only, so skip the nested-dict detour
+                leaf_model = next(leaf_models)
+                leaf_name = f'leaf-{dc}-{i+1:03d}'
+                # Shared DN prefix for this leaf's own record, its FEX, and
+                # their interfaces; inner loops only append suffixes
+                leaf_prefix = f'topology/pod-1/node-{leaf_id}'
+                chunk.append(
+                    f'{{"fabricNode":{{"attributes":{{'
+                    f'"dn":"{leaf_prefix}",'
+                    f'"id":"{leaf_id}",'
+                    f'"name":"{leaf_name}",'
+                    f'"role":"leaf",'
+                    f'"model":"{leaf_model["model"]}",'
+                    f'"serial":"LEAF{leaf_id:05d}SN",'
+                    f'"address":"{next(addresses)}",'
+                    f'"fabricSt":"active",'
+                    f'"operSt":"{next(leaf_oper)}"'  # 95% uptime
+                    f'}}}}}}'.encode('ascii')
+                )
+                self.leafs.append({'id': leaf_id, 'name': leaf_name,
                                  'model': leaf_model['model'], 'ports': leaf_model['ports']})
 
                 # Create FEX for this leaf
-                fex_count = random.randint(*self.config['fex_per_leaf_range'])
+                fex_count = int(next(fex_counts))
                 for j in range(fex_count):
-                    fex_model = random.choice(self.config['fex_models'])
-                    fex = {
-                        'eqptFex': {
-                            'attributes': {
-                                'dn': f'topology/pod-1/node-{leaf_id}/sys/fex-{fex_id}',
-                                'id': str(fex_id),
-                                'model': fex_model['model'],
-                                'serial': f'FEX{fex_id:06d}ABC',
-                                'operSt': random.choice(['up'] * 90 + ['down'] * 10),  # 90% uptime
-                                'descr': f'{dc} FEX {j+1}'
-                            }
-                        }
-                    }
-                    self.imdata.append(fex)
+                    fex_model = next(fex_models)
+                    fex_prefix = f'{leaf_prefix}/sys/fex-{fex_id}'
+                    chunk.append(
+                        f'{{"eqptFex":{{"attributes":{{'
+                        f'"dn":"{fex_prefix}",'
+                        f'"id":"{fex_id}",'
+                        f'"model":"{fex_model["model"]}",'
+                        f'"serial":"FEX{fex_id:06d}ABC",'
+                        f'"operSt":"{next(fex_oper)}",'  # 90% uptime
+                        f'"descr":"{dc} FEX {j+1}"'
+                        f'}}}}}}'.encode('ascii')
+                    )
                     self.fexes.append({
                         'id': fex_id,
                         'leaf_id': leaf_id,
@@ -156,38 +424,37 @@ class EnterpriseFabricGenerator:
                     })
 
                     # Generate interfaces for FEX
-                    self._generate_fex_interfaces(fex_id, leaf_id, fex_model['ports'])
+                    self._generate_fex_interfaces(fex_prefix, fex_model['ports'],
+                                                  float(next(fex_utils)), chunk)
 
                     fex_id += 1
 
                 leaf_id += 1
 
+        self._emit_chunk(chunk)
+
         print(f"   Generated {len(self.leafs)} leaf switches")
         print(f"   Generated {len(self.fexes)} FEX devices")
 
-    def _generate_fex_interfaces(self, fex_id: int, leaf_id: int, port_count: int):
-        """Generate interfaces for a FEX with realistic utilization."""
-        utilization = random.uniform(0.10, 0.70)  # 10-70% utilization
+    def _generate_fex_interfaces(self, fex_prefix: str, port_count: int,
+                                 utilization: float, out: List[Any]):
+        """Generate interfaces for a FEX with realistic utilization (10-70%)."""
         active_ports = int(port_count * utilization)
 
         for port in range(1, port_count + 1):
-            status = 'up' if port <= active_ports else 'down'
-            interface = {
-                'ethpmPhysIf': {
-                    'attributes': {
-                        'dn': f'topology/pod-1/node-{leaf_id}/sys/fex-{fex_id}/phys-[eth1/{port}]/phys',
-                        'operSt': status,
-                        'usage': 'fabric' if port <= 2 else 'epg',
-                        'portCap': '1G'
-                    }
-                }
-            }
-            self.imdata.append(interface)
+            out.append(_IFACE_TEMPLATE.format(
+                prefix=fex_prefix,
+                port=port,
+                status='up' if port <= active_ports else 'down',
+                usage='fabric' if port <= 2 else 'epg',
+            ).encode('ascii'))
 
     def _generate_tenants(self):
         """Generate tenants with VRFs and BDs."""
         print("\n2. Generating Tenants, VRFs, and Bridge Domains...")
 
+        chunk = []
+
         for tenant_config in self.config['tenants']:
             tenant_name = tenant_config['name']
 
@@ -201,11 +468,11 @@ class EnterpriseFabricGenerator:
                     }
                 }
             }
-            self.imdata.append(tenant)
+            chunk.append(tenant)
             self.tenants.append(tenant_name)
 
             # Create VRFs (3-5 per tenant)
-            vrf_count = random.randint(3, 5)
+            vrf_count = self.rng.randint(3, 5)
             tenant_vrfs = []
             for i in range(vrf_count):
                 vrf_name = f'{tenant_name}_VRF{i+1}'
@@ -214,34 +481,34 @@ class EnterpriseFabricGenerator:
                         'attributes': {
                             'dn': f'uni/tn-{tenant_name}/ctx-{vrf_name}',
                             'name': vrf_name,
-                            'pcEnfPref': 'enforced',
+                            'pcEnfPref': _ENFORCED,
                             'descr': f'VRF for {tenant_name}'
                         }
                     }
                 }
-                self.imdata.append(vrf)
+                chunk.append(vrf)
                 tenant_vrfs.append(vrf_name)
                 self.vrfs.append({'tenant': tenant_name, 'name': vrf_name})
 
             # Create BDs (8-12 per VRF)
             for vrf_name in tenant_vrfs:
-                bd_count = random.randint(8, 12)
+                bd_count = self.rng.randint(8, 12)
                 for i in range(bd_count):
                     bd_name = f'{vrf_name}_BD{i+1}'
-                    subnet = f'10.{random.randint(0, 255)}.{random.randint(0, 255)}.1/24'
+                    subnet = f'10.{self.rng.randint(0, 255)}.{self.rng.randint(0, 255)}.1/24'
 
                     bd = {
                         'fvBD': {
                             'attributes': {
                                 'dn': f'uni/tn-{tenant_name}/BD-{bd_name}',
                                 'name': bd_name,
-                                'arpFlood': 'yes',
-                                'unicastRoute': 'yes',
+                                'arpFlood': _YES,
+                                'unicastRoute': _YES,
                                 'descr': f'Bridge Domain for {tenant_name}'
                             }
                         }
                     }
-                    self.imdata.append(bd)
+                    chunk.append(bd)
                     self.bds.append({
                         'tenant': tenant_name,
                         'vrf': vrf_name,
@@ -255,21 +522,48 @@ class EnterpriseFabricGenerator:
                             'attributes': {
                                 'dn': f'uni/tn-{tenant_name}/BD-{bd_name}/subnet-[{subnet}]',
                                 'ip': subnet,
-                                'scope': 'public'
+                                'scope': _PUBLIC
                             }
                         }
                     }
-                    self.imdata.append(subnet_obj)
+                    chunk.append(subnet_obj)
+
+        self._emit_chunk(chunk)
 
         print(f"   Generated {len(self.tenants)} tenants")
         print(f"   Generated {len(self.vrfs)} VRFs")
         print(f"   Generated {len(self.bds)} Bridge Domains")
 
     def _generate_epgs_with_coupling(self):
-        """Generate EPGs with realistic coupling scenarios."""
+        """Generate EPGs with realistic coupling scenarios, one worker per tenant."""
         print("\n3. Generating EPGs with Coupling Scenarios...")
 
-        epg_id = 1
+        tenants = self.config['tenants']
+        patterns = self.config['deployment_patterns']
+        shared_vlan_prob = self.config['coupling_scenarios']['shared_vlans']
+
+        # Shard the VLAN pool into non-overlapping per-tenant slices so
+        # workers never hand out conflicting VLANs
+        vlan_pool = self.vlan_pool.tolist()
+        slice_size = max(1, len(vlan_pool) // len(tenants))
+
+        tasks = []
+        epg_id_start = 1
+        for i, tenant_config in enumerate(tenants):
+            tenant_bds = [bd for bd in self.bds if bd['tenant'] == tenant_config['name']]
+            vlan_slice = vlan_pool[i * slice_size:(i + 1) * slice_size] or vlan_pool
+            tasks.append((tenant_config, tenant_bds, self.fexes, self.leafs,
+                          self.config['data_centers'], patterns, shared_vlan_prob,
+                          vlan_slice, epg_id_start, 42 + i))
+            epg_id_start += (tenant_config['app_profiles']
+                             * (tenant_config['epg_count'] // tenant_config['app_profiles']))
+
+        if len(tasks) > 1:
+            with Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+                results = pool.starmap(_gen_tenant_epgs, tasks)
+        else:
+            results = [_gen_tenant_epgs(*task) for task in tasks]
+
         coupling_stats = {
             'fex_only': 0,
             'leaf_only': 0,
@@ -277,72 +571,15 @@ class EnterpriseFabricGenerator:
             'multi_fex': 0,
             'shared_vlans': 0
         }
-
-        for tenant_config in self.config['tenants']:
-            tenant_name = tenant_config['name']
-            epg_count = tenant_config['epg_count']
-            app_count = tenant_config['app_profiles']
-
-            # Get tenant's BDs
-            tenant_bds = [bd for bd in self.bds if bd['tenant'] == tenant_name]
-
-            for app_idx in range(app_count):
-                app_name = f'{tenant_name}_APP{app_idx+1}'
-                epgs_per_app = epg_count // app_count
-
-                for epg_idx in range(epgs_per_app):
-                    epg_name = f'EPG{epg_id:04d}_{app_name}'
-                    bd = random.choice(tenant_bds)
-
-                    # Determine deployment pattern
-                    pattern = self._choose_deployment_pattern()
-                    coupling_stats[pattern] += 1
-
-                    # Generate VLAN and path attachments based on pattern
-                    vlans, devices = self._generate_epg_deployment(pattern, epg_name)
-
-                    # Check for VLAN sharing (coupling scenario)
-                    if random.random() < self.config['coupling_scenarios']['shared_vlans']:
-                        # Reuse an existing VLAN from same device
-                        device_id = devices[0] if devices else None
-                        if device_id and device_id in self.used_vlans and self.used_vlans[device_id]:
-                            vlans[0] = random.choice(list(self.used_vlans[device_id]))
-                            coupling_stats['shared_vlans'] += 1
-
-                    # Track VLAN usage
-                    for device_id, vlan in zip(devices, vlans):
-                        if device_id not in self.used_vlans:
-                            self.used_vlans[device_id] = set()
-                        self.used_vlans[device_id].add(vlan)
-
-                    # Create EPG
-                    epg = {
-                        'fvAEPg': {
-                            'attributes': {
-                                'dn': f'uni/tn-{tenant_name}/ap-{app_name}/epg-{epg_name}',
-                                'name': epg_name,
-                                'descr': f'{pattern} deployment',
-                                'pcEnfPref': 'enforced',
-                                'prefGrMemb': 'exclude'
-                            }
-                        }
-                    }
-                    self.imdata.append(epg)
-
-                    self.epgs.append({
-                        'tenant': tenant_name,
-                        'app': app_name,
-                        'name': epg_name,
-                        'bd': bd['name'],
-                        'pattern': pattern,
-                        'vlans': vlans,
-                        'devices': devices
-                    })
-
-                    # Generate path attachments
-                    self._generate_path_attachments(tenant_name, app_name, epg_name, devices, vlans)
-
-                    epg_id += 1
+        for epgs, imdata_chunk, used_vlans, stats in results:
+            self.epgs.extend(epgs)
+            self._emit_chunk(imdata_chunk)
+            for device_id, vlans in used_vlans.items():
+                if device_id not in self.used_vlans:
+                    self.used_vlans[device_id] = set()
+                self.used_vlans[device_id].update(vlans)
+            for pattern, count in stats.items():
+                coupling_stats[pattern] += count
 
         print(f"   Generated {len(self.epgs)} EPGs")
         print(f"\n   Deployment Patterns:")
@@ -350,113 +587,18 @@ class EnterpriseFabricGenerator:
             pct = (count / len(self.epgs) * 100) if self.epgs else 0
             print(f"      {pattern:20s}: {count:4d} ({pct:5.1f}%)")
 
-    def _choose_deployment_pattern(self) -> str:
-        """Choose deployment pattern based on configured probabilities."""
-        rand = random.random()
-        patterns = self.config['deployment_patterns']
-
-        cumulative = 0
-        for pattern, prob in patterns.items():
-            cumulative += prob
-            if rand <= cumulative:
-                return pattern
-
-        return 'fex_only'  # Default
-
-    def _generate_epg_deployment(self, pattern: str, epg_name: str) -> Tuple[List[int], List[str]]:
-        """Generate VLAN and device assignments based on deployment pattern."""
-        vlans = []
-        devices = []
-
-        if pattern == 'fex_only':
-            # Single FEX
-            fex = random.choice(self.fexes)
-            vlan = self._get_next_vlan()
-            vlans.append(vlan)
-            devices.append(f"fex-{fex['id']}")
-
-        elif pattern == 'leaf_only':
-            # Single leaf
-            leaf = random.choice(self.leafs)
-            vlan = self._get_next_vlan()
-            vlans.append(vlan)
-            devices.append(f"leaf-{leaf['id']}")
-
-        elif pattern == 'fex_and_leaf':
-            # Both FEX and leaf (coupling!)
-            fex = random.choice(self.fexes)
-            leaf_id = fex['leaf_id']
-            vlan = self._get_next_vlan()
-            vlans.extend([vlan, vlan])  # Same VLAN on both
-            devices.extend([f"fex-{fex['id']}", f"leaf-{leaf_id}"])
-
-        elif pattern == 'multi_fex':
-            # Multiple FEX (high coupling!)
-            fex_count = random.randint(2, 4)
-            # Try to get FEX from same DC for realism
-            dc = random.choice(self.config['data_centers'])
-            dc_fexes = [f for f in self.fexes if f['dc'] == dc]
-            if len(dc_fexes) < fex_count:
-                dc_fexes = self.fexes
-
-            selected_fexes = random.sample(dc_fexes, min(fex_count, len(dc_fexes)))
-            vlan = self._get_next_vlan()
-            for fex in selected_fexes:
-                vlans.append(vlan)  # Same VLAN across all FEX
-                devices.append(f"fex-{fex['id']}")
-
-        return vlans, devices
-
-    def _get_next_vlan(self) -> int:
-        """Get next available VLAN from pool."""
-        if self.vlan_idx >= len(self.vlan_pool):
-            # Wrap around if we run out
-            self.vlan_idx = 0
-        vlan = self.vlan_pool[self.vlan_idx]
-        self.vlan_idx += 1
-        return vlan
-
-    def _generate_path_attachments(self, tenant: str, app: str, epg: str,
-                                   devices: List[str], vlans: List[int]):
-        """Generate path attachments for EPG."""
-        for device, vlan in zip(devices, vlans):
-            if device.startswith('fex-'):
-                fex_id = device.split('-')[1]
-                # Find leaf for this FEX
-                fex_info = next((f for f in self.fexes if str(f['id']) == fex_id), None)
-                if fex_info:
-                    leaf_id = fex_info['leaf_id']
-                    path_dn = f'topology/pod-1/paths-{leaf_id}/pathep-[eth{fex_id}/1/1]'
-                else:
-                    continue
-            else:  # leaf
-                leaf_id = device.split('-')[1]
-                path_dn = f'topology/pod-1/paths-{leaf_id}/pathep-[eth1/1]'
-
-            path_att = {
-                'fvRsPathAtt': {
-                    'attributes': {
-                        'dn': f'uni/tn-{tenant}/ap-{app}/epg-{epg}/rspathAtt-[{path_dn}]',
-                        'tDn': path_dn,
-                        'encap': f'vlan-{vlan}',
-                        'mode': 'regular',
-                        'instrImedcy': 'immediate'
-                    }
-                }
-            }
-            self.imdata.append(path_att)
-
     def _generate_contracts(self):
         """Generate contracts including cross-tenant contracts."""
         print("\n4. Generating Contracts...")
 
+        chunk = []
         total_contracts = 150
         cross_tenant_count = int(total_contracts *
                                 self.config['coupling_scenarios']['cross_tenant_contracts'])
 
         # Intra-tenant contracts
         for i in range(total_contracts - cross_tenant_count):
-            tenant = random.choice(self.tenants)
+            tenant = self.rng.choice(self.tenants)
             contract_name = f'Contract_{tenant}_{i+1}'
 
             contract = {
@@ -469,7 +611,7 @@ class EnterpriseFabricGenerator:
                     }
                 }
             }
-            self.imdata.append(contract)
+            chunk.append(contract)
             self.contracts.append({
                 'tenant': tenant,
                 'name': contract_name,
@@ -479,7 +621,7 @@ class EnterpriseFabricGenerator:
 
         # Cross-tenant contracts (coupling!)
         for i in range(cross_tenant_count):
-            tenant = random.choice(self.tenants)
+            tenant = self.rng.choice(self.tenants)
             contract_name = f'XTenant_Contract_{i+1}'
 
             contract = {
@@ -492,7 +634,7 @@ class EnterpriseFabricGenerator:
                     }
                 }
             }
-            self.imdata.append(contract)
+            chunk.append(contract)
             self.contracts.append({
                 'tenant': tenant,
                 'name': contract_name,
@@ -500,6 +642,8 @@ class EnterpriseFabricGenerator:
                 'type': 'cross-tenant'
             })
 
+        self._emit_chunk(chunk)
+
         print(f"   Generated {len(self.contracts)} contracts")
         print(f"      Intra-tenant: {total_contracts - cross_tenant_count}")
         print(f"      Cross-tenant: {cross_tenant_count} (coupling)")
@@ -508,6 +652,13 @@ class EnterpriseFabricGenerator:
         """Generate CMDB correlation data."""
         print("\n5. Generating CMDB Data...")
 
+        # One clock read for the whole phase, with all purchase-date
+        # offsets drawn in a single batch; isoformat()[:10] is equivalent
+        # to strftime('%Y-%m-%d') at a fraction of the cost
+        now = datetime.now()
+        days = iter(self.np_rng.integers(30, 1096, size=len(self.leafs) + len(self.fexes)))
+        records = []
+
         # Add all leafs
         for leaf in self.leafs:
             record = {
@@ -516,11 +667,11 @@ class EnterpriseFabricGenerator:
                 'model': leaf['model'],
                 'device_type': 'Leaf Switch',
                 'location': leaf['name'].split('-')[1] if '-' in leaf['name'] else 'Unknown',
-                'rack': f'R{random.randint(1, 40):02d}',
-                'status': 'Active',
-                'purchase_date': (datetime.now() - timedelta(days=random.randint(30, 1095))).strftime('%Y-%m-%d')
+                'rack': f'R{self.rng.randint(1, 40):02d}',
+                'status': _ACTIVE,
+                'purchase_date': (now - timedelta(days=int(next(days)))).isoformat()[:10]
             }
-            self.cmdb_records.append(record)
+            records.append(record)
 
         # Add all FEX
         for fex in self.fexes:
@@ -530,11 +681,13 @@ class EnterpriseFabricGenerator:
                 'model': fex['model'],
                 'device_type': 'FEX',
                 'location': fex['dc'],
-                'rack': f'R{random.randint(1, 40):02d}',
-                'status': 'Active',
-                'purchase_date': (datetime.now() - timedelta(days=random.randint(30, 1095))).strftime('%Y-%m-%d')
+                'rack': f'R{self.rng.randint(1, 40):02d}',
+                'status': _ACTIVE,
+                'purchase_date': (now - timedelta(days=int(next(days)))).isoformat()[:10]
             }
-            self.cmdb_records.append(record)
+            records.append(record)
+
+        self.cmdb_records.extend(records)
 
         print(f"   Generated {len(self.cmdb_records)} CMDB records")
 
@@ -558,11 +711,12 @@ class EnterpriseFabricGenerator:
         print(f"  Cross-Tenant:         {cross_tenant} ({cross_tenant/len(self.contracts)*100:.1f}%)")
         print(f"\nCoupling Analysis:")
 
-        # Calculate coupling metrics
-        fex_only = sum(1 for e in self.epgs if e['pattern'] == 'fex_only')
-        leaf_only = sum(1 for e in self.epgs if e['pattern'] == 'leaf_only')
-        fex_and_leaf = sum(1 for e in self.epgs if e['pattern'] == 'fex_and_leaf')
-        multi_fex = sum(1 for e in self.epgs if e['pattern'] == 'multi_fex')
+        # Calculate coupling metrics in one pass over the EPG list
+        pattern_counts = Counter(e['pattern'] for e in self.epgs)
+        fex_only = pattern_counts['fex_only']
+        leaf_only = pattern_counts['leaf_only']
+        fex_and_leaf = pattern_counts['fex_and_leaf']
+        multi_fex = pattern_counts['multi_fex']
 
         coupled_epgs = fex_and_leaf + multi_fex
         print(f"  EPGs with Coupling:   {coupled_epgs} ({coupled_epgs/len(self.epgs)*100:.1f}%)")
@@ -570,25 +724,27 @@ class EnterpriseFabricGenerator:
         print(f"    Multi-FEX:          {multi_fex}")
         print(f"  Standalone EPGs:      {fex_only + leaf_only}")
 
-        # VLAN sharing analysis
-        shared_vlans = 0
-        for device_id, vlans in self.used_vlans.items():
-            # Count EPGs using each VLAN
-            for vlan in vlans:
-                epg_count = sum(1 for e in self.epgs if vlan in e['vlans'] and device_id in
-                              [f"fex-{d.split('-')[1]}" if 'fex' in d else f"leaf-{d.split('-')[1]}"
-                               for d in e['devices']])
-                if epg_count > 1:
-                    shared_vlans += 1
+        # VLAN sharing analysis: one linear pass over all EPG attachments
+        # instead of re-scanning every EPG for each (device, VLAN) pair
+        usage = Counter()
+        for e in self.epgs:
+            for device_id, vlan in zip(e['devices'], e['vlans']):
+                usage[(device_id, vlan)] += 1
+        shared_vlans = sum(1 for count in usage.values() if count > 1)
 
         print(f"  Shared VLANs:         {shared_vlans}")
         print(f"\nData Volume:")
-        print(f"  Total ACI Objects:    {len(self.imdata)}")
+        print(f"  Total ACI Objects:    {self.object_count}")
         print(f"  CMDB Records:         {len(self.cmdb_records)}")
 
 
 def main():
     """Generate enterprise fabric data and save to files."""
+    parser = argparse.ArgumentParser(description='Generate enterprise-scale ACI fabric data')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Pretty-print the ACI JSON output (slower, ~2x file size)')
+    args = parser.parse_args()
+
     print("Enterprise-Scale ACI Fabric Data Generator")
     print("=" * 70)
 
@@ -596,25 +752,23 @@ def main():
     output_dir = Path("data/samples")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate data
-    generator = EnterpriseFabricGenerator(CONFIG)
-    aci_data, cmdb_data = generator.generate()
-
-    # Save ACI data
+    # Generate data, streaming ACI records to disk as each phase completes
     aci_file = output_dir / "sample_enterprise_1000epg.json"
-    with open(aci_file, 'w') as f:
-        json.dump(aci_data, f, indent=2)
+    generator = EnterpriseFabricGenerator(CONFIG)
+    cmdb_data = generator.generate_to_file(aci_file, pretty=args.pretty)
 
     print(f"\nSaved ACI data to: {aci_file}")
     print(f"  File size: {aci_file.stat().st_size / 1024 / 1024:.2f} MB")
 
-    # Save CMDB data
+    # Save CMDB data: plain csv.writer over pre-extracted rows avoids
+    # DictWriter's per-field dict lookup on every record
     cmdb_file = output_dir / "sample_enterprise_1000epg_cmdb.csv"
-    with open(cmdb_file, 'w', newline='') as f:
+    with open(cmdb_file, 'w', buffering=1 << 20, newline='') as f:
         if cmdb_data:
-            writer = csv.DictWriter(f, fieldnames=cmdb_data[0].keys())
-            writer.writeheader()
-            writer.writerows(cmdb_data)
+            fieldnames = list(cmdb_data[0].keys())
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows([record[k] for k in fieldnames] for record in cmdb_data)
 
     print(f"Saved CMDB data to: {cmdb_file}")
     print(f"  File size: {cmdb_file.stat().st_size / 1024:.2f} KB")
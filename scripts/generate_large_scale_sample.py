@@ -3,10 +3,47 @@
 Generate Large-Scale ACI Sample Data
 Creates realistic ACI fabric with 110 leafs and 316 FEX devices
 """
+import csv
 import json
 import random
+import sys
+import time
+from itertools import chain
 from datetime import datetime
 
+import numpy as np
+
+# Batched random draws: one NumPy call replaces thousands of Python-level
+# random.choice/randint calls in the per-object loops below
+rng = np.random.default_rng()
+
+# orjson encodes roughly 5x faster than stdlib json; fall back silently
+# when unavailable. Both paths return compact JSON as bytes.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Leaf records have a fixed schema, so the JSON text is produced by
+# template substitution instead of building a dict and encoding it
+LEAF_TEMPLATE = (
+    '{{"fabricNode":{{"attributes":{{"dn":"topology/pod-{pod}/node-{id}",'
+    '"id":"{id}","name":"leaf-{site}-{num:03d}","role":"leaf","model":"{model}",'
+    '"serial":"LEAF{id:05d}SN","address":"10.{pod}.{a}.{b}",'
+    '"fabricSt":"active","operSt":"up"}}}}}}'
+)
+
+# FEX physical interfaces are by far the most numerous object type;
+# emit them the same way
+IF_TEMPLATE = (
+    '{{"ethpmPhysIf":{{"attributes":{{"dn":"{prefix}/phys-[{id}]",'
+    '"id":"{id}","operSt":"{oper}","adminSt":"up","operSpeed":"{speed}"}}}}}}'
+)
+
 # Configuration
 NUM_LEAFS = 110
 NUM_FEX = 316
@@ -17,89 +54,34 @@ NUM_EPGS_PER_BD = 3
 NUM_CONTRACTS = 50
 PORTS_PER_FEX = 48
 
-def generate_fabric():
-    """Generate complete ACI fabric data."""
-
-    print(f"Generating ACI fabric data:")
-    print(f"  - {NUM_LEAFS} leaf switches")
-    print(f"  - {NUM_FEX} FEX devices")
-    print(f"  - {NUM_TENANTS} tenants")
-    print(f"  - ~{NUM_TENANTS * NUM_VRFS_PER_TENANT * NUM_BDS_PER_VRF} bridge domains")
-    print(f"  - ~{NUM_TENANTS * NUM_VRFS_PER_TENANT * NUM_BDS_PER_VRF * NUM_EPGS_PER_BD} EPGs")
-    print()
-
-    imdata = []
-
-    # Generate leaf switches (distributed across 2 pods, 5 sites)
-    print("Generating leaf switches...")
-    pods = [1, 2]
-    sites = ['NYC-DC1', 'NYC-DC2', 'SFO-DC1', 'CHI-DC1', 'DAL-DC1']
-
-    leafs_per_site = NUM_LEAFS // len(sites)
-    leaf_id = 101
-
-    for site_idx, site in enumerate(sites):
-        for i in range(leafs_per_site):
-            pod = pods[site_idx % len(pods)]
-
-            leaf = {
-                "fabricNode": {
-                    "attributes": {
-                        "dn": f"topology/pod-{pod}/node-{leaf_id}",
-                        "id": str(leaf_id),
-                        "name": f"leaf-{site}-{i+1:03d}",
-                        "role": "leaf",
-                        "model": random.choice([
-                            "N9K-C93180YC-EX",
-                            "N9K-C93180YC-FX",
-                            "N9K-C9336C-FX2",
-                            "N9K-C9348GC-FXP"
-                        ]),
-                        "serial": f"LEAF{leaf_id:05d}SN",
-                        "address": f"10.{pod}.{leaf_id // 256}.{leaf_id % 256}",
-                        "fabricSt": "active",
-                        "operSt": "up"
-                    }
-                }
-            }
-            imdata.append(leaf)
-            leaf_id += 1
+# Shared immutable catalogs (module level so they are built once and
+# shared by the fabric and CMDB generators)
+SITES = ('NYC-DC1', 'NYC-DC2', 'SFO-DC1', 'CHI-DC1', 'DAL-DC1')
+LEAF_MODELS = ('N9K-C93180YC-EX', 'N9K-C93180YC-FX',
+               'N9K-C9336C-FX2', 'N9K-C9348GC-FXP')
+FEX_MODELS = ('N2K-C2248TP-E-1GE', 'N2K-C2348UPQ',
+              'N2K-C2232PP-10GE', 'N2K-C2348TQ')
+TENANT_NAMES = ('Production', 'Development', 'QA', 'Finance',
+                'HR', 'Engineering', 'Sales', 'Marketing')[:NUM_TENANTS]
 
-    # Fill remaining leafs
-    remaining = NUM_LEAFS - (leafs_per_site * len(sites))
-    for i in range(remaining):
-        leaf = {
-            "fabricNode": {
-                "attributes": {
-                    "dn": f"topology/pod-1/node-{leaf_id}",
-                    "id": str(leaf_id),
-                    "name": f"leaf-MISC-{i+1:03d}",
-                    "role": "leaf",
-                    "model": "N9K-C93180YC-EX",
-                    "serial": f"LEAF{leaf_id:05d}SN"
-                }
-            }
-        }
-        imdata.append(leaf)
-        leaf_id += 1
 
-    # Generate FEX devices (distributed across leafs)
-    print(f"Generating {NUM_FEX} FEX devices...")
+def build_fex_distribution():
+    """
+    Distribute FEX devices across leafs (some have 0, some up to 12).
 
-    # Distribute FEX across leafs (some leafs have more, some have less)
-    # Create realistic distribution with some leafs having 0, some having up to 12
-    leaf_ids = list(range(101, 101 + NUM_LEAFS))
-    fex_distribution = {}
+    Returns a list of FEX counts, one entry per leaf in id order
+    (zip with ``range(101, 101 + NUM_LEAFS)`` to recover leaf ids).
+    """
+    fex_distribution = [0] * NUM_LEAFS
 
-    # Assign FEX to leafs
     fex_assigned = 0
-    for leaf in leaf_ids:
+    for idx in range(NUM_LEAFS):
         # Random number of FEX per leaf (0-12, weighted towards 2-4)
         if fex_assigned >= NUM_FEX:
             fex_count = 0
         else:
             remaining_fex = NUM_FEX - fex_assigned
-            remaining_leafs = len(leaf_ids) - leaf_ids.index(leaf)
+            remaining_leafs = NUM_LEAFS - idx
             avg_per_leaf = max(1, remaining_fex // remaining_leafs)
 
             # Some variation
@@ -108,93 +90,133 @@ def generate_fabric():
                 min(12, avg_per_leaf + 3, remaining_fex)
             )
 
-        fex_distribution[leaf] = fex_count
+        fex_distribution[idx] = fex_count
         fex_assigned += fex_count
 
-    # Generate FEX objects
+    return fex_distribution
+
+
+def iter_leafs():
+    """Yield leaf switches (distributed across 2 pods, 5 sites)."""
+    print("Generating leaf switches...")
+    pods = (1, 2)
+
+    model_picks = iter(rng.integers(0, len(LEAF_MODELS), size=NUM_LEAFS).tolist())
+
+    leafs_per_site = NUM_LEAFS // len(SITES)
+    leaf_id = 101
+
+    for site_idx, site in enumerate(SITES):
+        for i in range(leafs_per_site):
+            pod = pods[site_idx % len(pods)]
+
+            yield LEAF_TEMPLATE.format(
+                pod=pod,
+                id=leaf_id,
+                site=site,
+                num=i + 1,
+                model=LEAF_MODELS[next(model_picks)],
+                a=leaf_id // 256,
+                b=leaf_id % 256,
+            ).encode('ascii')
+            leaf_id += 1
+
+    # Fill remaining leafs
+    remaining = NUM_LEAFS - (leafs_per_site * len(SITES))
+    for i in range(remaining):
+        yield ("fabricNode", {
+            "dn": f"topology/pod-1/node-{leaf_id}",
+            "id": str(leaf_id),
+            "name": f"leaf-MISC-{i+1:03d}",
+            "role": "leaf",
+            "model": "N9K-C93180YC-EX",
+            "serial": f"LEAF{leaf_id:05d}SN"
+        })
+        leaf_id += 1
+
+
+def iter_fex(fex_distribution):
+    """Yield FEX devices and a sample of their physical interfaces."""
+    print(f"Generating {NUM_FEX} FEX devices...")
+
+    total_fex = sum(fex_distribution)
+    ports_per_fex = min(PORTS_PER_FEX, 10) - 1
+    model_picks = iter(rng.integers(0, len(FEX_MODELS), size=total_fex).tolist())
+    fex_up = iter((rng.random(total_fex) < 0.95).tolist())  # 95% up
+    port_connected = iter(
+        (rng.random(total_fex * ports_per_fex) < 0.65).tolist())  # 65% port utilization
+
     fex_id = 101
     fex_serial_id = 1000
 
-    for leaf_id, fex_count in fex_distribution.items():
+    for leaf_id, fex_count in zip(range(101, 101 + NUM_LEAFS), fex_distribution):
+        pod = 1 if leaf_id < 200 else 2
+        # Invariant for every FEX and interface under this leaf
+        node_prefix = f"topology/pod-{pod}/node-{leaf_id}/sys"
+
         for i in range(fex_count):
-            pod = 1 if leaf_id < 200 else 2
-
-            fex = {
-                "eqptFex": {
-                    "attributes": {
-                        "dn": f"topology/pod-{pod}/node-{leaf_id}/sys/extch-{fex_id}",
-                        "id": str(fex_id),
-                        "ser": f"FEX{fex_serial_id:06d}ABC",
-                        "model": random.choice([
-                            "N2K-C2248TP-E-1GE",
-                            "N2K-C2348UPQ",
-                            "N2K-C2232PP-10GE",
-                            "N2K-C2348TQ"
-                        ]),
-                        "operSt": random.choice(["up"] * 95 + ["down"] * 5),  # 95% up
-                        "descr": f"FEX for leaf {leaf_id}",
-                        "vendor": "Cisco Systems, Inc."
-                    }
-                }
-            }
-            imdata.append(fex)
+            yield ("eqptFex", {
+                "dn": f"{node_prefix}/extch-{fex_id}",
+                "id": str(fex_id),
+                "ser": f"FEX{fex_serial_id:06d}ABC",
+                "model": FEX_MODELS[next(model_picks)],
+                "operSt": "up" if next(fex_up) else "down",
+                "descr": f"FEX for leaf {leaf_id}",
+                "vendor": "Cisco Systems, Inc."
+            })
 
             # Add physical interfaces for this FEX (sample a few)
+            if_prefix = f"eth{fex_id}/1/"
             for port in range(1, min(PORTS_PER_FEX, 10)):  # Only add first 10 ports to keep file size reasonable
-                is_connected = random.random() < 0.65  # 65% port utilization
-
-                interface = {
-                    "ethpmPhysIf": {
-                        "attributes": {
-                            "dn": f"topology/pod-{pod}/node-{leaf_id}/sys/phys-[eth{fex_id}/1/{port}]",
-                            "id": f"eth{fex_id}/1/{port}",
-                            "operSt": "up" if is_connected else "down",
-                            "adminSt": "up",
-                            "operSpeed": "1G" if is_connected else "unknown"
-                        }
-                    }
-                }
-                imdata.append(interface)
+                is_connected = next(port_connected)
+
+                yield IF_TEMPLATE.format(
+                    prefix=node_prefix,
+                    id=f"{if_prefix}{port}",
+                    oper="up" if is_connected else "down",
+                    speed="1G" if is_connected else "unknown",
+                ).encode('ascii')
 
             fex_id += 1
             fex_serial_id += 1
 
-    # Generate tenants
+
+def iter_tenants(fex_distribution, tenant_names):
+    """Yield tenants with their VRFs, BDs, subnets, EPGs, and path attachments."""
     print(f"Generating {NUM_TENANTS} tenants...")
-    tenant_names = [
-        'Production', 'Development', 'QA', 'Finance',
-        'HR', 'Engineering', 'Sales', 'Marketing'
-    ][:NUM_TENANTS]
+
+    total_epgs = (NUM_TENANTS * NUM_VRFS_PER_TENANT
+                  * NUM_BDS_PER_VRF * NUM_EPGS_PER_BD)
+    attachment_counts = iter(rng.integers(1, 4, size=total_epgs).tolist())
+    port_picks = iter(rng.integers(1, 49, size=total_epgs * 3).tolist())
+    # One batched draw covers every EPG's FEX picks; rows are sliced to the
+    # attachment count. Occasional duplicate picks within a row are
+    # acceptable for a synthetic fixture.
+    fex_selections = rng.integers(
+        101, 101 + min(50, NUM_FEX), size=(total_epgs, 3))
 
     epg_counter = 0
 
-    for tenant_name in tenant_names:
+    for tenant_idx, tenant_name in enumerate(tenant_names):
+        # Invariant prefix for everything under this tenant
+        tn_prefix = f"uni/tn-{tenant_name}"
+
         # Tenant
-        tenant = {
-            "fvTenant": {
-                "attributes": {
-                    "dn": f"uni/tn-{tenant_name}",
-                    "name": tenant_name,
-                    "descr": f"{tenant_name} tenant"
-                }
-            }
-        }
-        imdata.append(tenant)
+        yield ("fvTenant", {
+            "dn": tn_prefix,
+            "name": tenant_name,
+            "descr": f"{tenant_name} tenant"
+        })
 
         # VRFs per tenant
         for vrf_idx in range(NUM_VRFS_PER_TENANT):
             vrf_name = f"{tenant_name}-VRF{vrf_idx+1}"
 
-            vrf = {
-                "fvCtx": {
-                    "attributes": {
-                        "dn": f"uni/tn-{tenant_name}/ctx-{vrf_name}",
-                        "name": vrf_name,
-                        "pcEnfPref": "enforced"
-                    }
-                }
-            }
-            imdata.append(vrf)
+            yield ("fvCtx", {
+                "dn": f"{tn_prefix}/ctx-{vrf_name}",
+                "name": vrf_name,
+                "pcEnfPref": "enforced"
+            })
 
             # Application profiles
             app_profile = f"{tenant_name}-APP"
@@ -202,57 +224,46 @@ def generate_fabric():
             # Bridge domains per VRF
             for bd_idx in range(NUM_BDS_PER_VRF):
                 bd_name = f"{tenant_name}-BD{bd_idx+1}"
+                bd_prefix = f"{tn_prefix}/BD-{bd_name}"
 
-                bd = {
-                    "fvBD": {
-                        "attributes": {
-                            "dn": f"uni/tn-{tenant_name}/BD-{bd_name}",
-                            "name": bd_name,
-                            "vrf": vrf_name,
-                            "arpFlood": "no",
-                            "unicastRoute": "yes"
-                        }
-                    }
-                }
-                imdata.append(bd)
+                yield ("fvBD", {
+                    "dn": bd_prefix,
+                    "name": bd_name,
+                    "vrf": vrf_name,
+                    "arpFlood": "no",
+                    "unicastRoute": "yes"
+                })
 
                 # Subnet for BD
                 subnet_third_octet = (vrf_idx * 50) + bd_idx
-                subnet = {
-                    "fvSubnet": {
-                        "attributes": {
-                            "dn": f"uni/tn-{tenant_name}/BD-{bd_name}/subnet-[10.{tenant_names.index(tenant_name)}.{subnet_third_octet}.1/24]",
-                            "ip": f"10.{tenant_names.index(tenant_name)}.{subnet_third_octet}.1/24",
-                            "scope": "public"
-                        }
-                    }
-                }
-                imdata.append(subnet)
+                subnet_ip = f"10.{tenant_idx}.{subnet_third_octet}.1/24"
+                yield ("fvSubnet", {
+                    "dn": f"{bd_prefix}/subnet-[{subnet_ip}]",
+                    "ip": subnet_ip,
+                    "scope": "public"
+                })
 
                 # EPGs per BD
                 for epg_idx in range(NUM_EPGS_PER_BD):
                     epg_name = f"{tenant_name}-EPG{epg_idx+1}-{bd_name}"
+                    epg_prefix = f"{tn_prefix}/ap-{app_profile}/epg-{epg_name}"
 
-                    epg = {
-                        "fvAEPg": {
-                            "attributes": {
-                                "dn": f"uni/tn-{tenant_name}/ap-{app_profile}/epg-{epg_name}",
-                                "name": epg_name,
-                                "bd": bd_name
-                            }
-                        }
-                    }
-                    imdata.append(epg)
+                    yield ("fvAEPg", {
+                        "dn": epg_prefix,
+                        "name": epg_name,
+                        "bd": bd_name
+                    })
 
                     # Create path attachments (EPG to FEX bindings)
                     # Each EPG is attached to 1-3 random FEX devices
-                    num_attachments = random.randint(1, 3)
-                    selected_fex = random.sample(range(101, 101 + min(50, NUM_FEX)), num_attachments)
+                    num_attachments = next(attachment_counts)
+                    selected_fex = fex_selections[epg_counter, :num_attachments].tolist()
 
                     for fex_node_id in selected_fex:
                         # Find the leaf this FEX is attached to
                         leaf_id = None
-                        for lid, fcount in fex_distribution.items():
+                        for lid, fcount in zip(range(101, 101 + NUM_LEAFS),
+                                               fex_distribution):
                             if fcount > 0:
                                 leaf_id = lid
                                 break
@@ -260,100 +271,92 @@ def generate_fabric():
                         if leaf_id:
                             vlan = 100 + (epg_counter % 900)  # VLANs 100-999
                             pod = 1
-                            port = random.randint(1, 48)
-
-                            path_att = {
-                                "fvRsPathAtt": {
-                                    "attributes": {
-                                        "dn": f"uni/tn-{tenant_name}/ap-{app_profile}/epg-{epg_name}/rspathAtt-[topology/pod-{pod}/paths-{leaf_id}/extpaths-{fex_node_id}/pathep-[eth1/{port}]]",
-                                        "tDn": f"topology/pod-{pod}/paths-{leaf_id}/extpaths-{fex_node_id}/pathep-[eth1/{port}]",
-                                        "encap": f"vlan-{vlan}",
-                                        "mode": "regular"
-                                    }
-                                }
-                            }
-                            imdata.append(path_att)
+                            port = next(port_picks)
+
+                            tdn = (f"topology/pod-{pod}/paths-{leaf_id}"
+                                   f"/extpaths-{fex_node_id}/pathep-[eth1/{port}]")
+                            yield ("fvRsPathAtt", {
+                                "dn": f"{epg_prefix}/rspathAtt-[{tdn}]",
+                                "tDn": tdn,
+                                "encap": f"vlan-{vlan}",
+                                "mode": "regular"
+                            })
 
                     epg_counter += 1
 
-    # Generate contracts
+
+def iter_contracts(tenant_names):
+    """Yield contracts spread across the tenants."""
     print(f"Generating {NUM_CONTRACTS} contracts...")
+    scopes = ["context", "tenant", "global"]
+    prios = ["default", "level1", "level2"]
+    tenant_picks = iter(rng.integers(0, len(tenant_names), size=NUM_CONTRACTS).tolist())
+    scope_picks = iter(rng.integers(0, len(scopes), size=NUM_CONTRACTS).tolist())
+    prio_picks = iter(rng.integers(0, len(prios), size=NUM_CONTRACTS).tolist())
+
     for contract_idx in range(NUM_CONTRACTS):
-        tenant = random.choice(tenant_names)
-
-        contract = {
-            "vzBrCP": {
-                "attributes": {
-                    "dn": f"uni/tn-{tenant}/brc-Contract-{contract_idx+1}",
-                    "name": f"Contract-{contract_idx+1}",
-                    "scope": random.choice(["context", "tenant", "global"]),
-                    "prio": random.choice(["default", "level1", "level2"])
-                }
-            }
-        }
-        imdata.append(contract)
-
-    # Generate some L3Outs
+        tenant = tenant_names[next(tenant_picks)]
+
+        yield ("vzBrCP", {
+            "dn": f"uni/tn-{tenant}/brc-Contract-{contract_idx+1}",
+            "name": f"Contract-{contract_idx+1}",
+            "scope": scopes[next(scope_picks)],
+            "prio": prios[next(prio_picks)]
+        })
+
+
+def iter_l3outs(tenant_names):
+    """Yield L3Outs and external EPGs for the first few tenants."""
     print("Generating L3Outs...")
     for tenant in tenant_names[:3]:  # Only first 3 tenants have L3Outs
-        l3out = {
-            "l3extOut": {
-                "attributes": {
-                    "dn": f"uni/tn-{tenant}/out-Internet-L3Out",
-                    "name": "Internet-L3Out"
-                }
-            }
-        }
-        imdata.append(l3out)
-
-        external_epg = {
-            "l3extInstP": {
-                "attributes": {
-                    "dn": f"uni/tn-{tenant}/out-Internet-L3Out/instP-External-Networks",
-                    "name": "External-Networks"
-                }
-            }
-        }
-        imdata.append(external_epg)
-
-    print(f"\nGenerated {len(imdata)} total objects")
-
-    return {"imdata": imdata}
-
-
-def generate_cmdb_data():
-    """Generate CMDB CSV data matching the fabric."""
+        yield ("l3extOut", {
+            "dn": f"uni/tn-{tenant}/out-Internet-L3Out",
+            "name": "Internet-L3Out"
+        })
+
+        yield ("l3extInstP", {
+            "dn": f"uni/tn-{tenant}/out-Internet-L3Out/instP-External-Networks",
+            "name": "External-Networks"
+        })
+
+
+def generate_cmdb_data(f_out):
+    """Write CMDB CSV data matching the fabric to ``f_out``; returns row count."""
 
     print("\nGenerating CMDB data...")
 
-    records = []
-    records.append("SerialNumber,Rack,Building,Hall,Site,InstallDate,Owner")
+    writer = csv.writer(f_out)
+    writer.writerow(["SerialNumber", "Rack", "Building", "Hall", "Site",
+                     "InstallDate", "Owner"])
+    record_count = 0
 
     # Leaf serials
     for leaf_id in range(101, 101 + NUM_LEAFS):
         site_idx = (leaf_id - 101) // (NUM_LEAFS // 5)
-        sites = ['NYC-DC1', 'NYC-DC2', 'SFO-DC1', 'CHI-DC1', 'DAL-DC1']
-        site = sites[min(site_idx, len(sites)-1)]
+        site = SITES[min(site_idx, len(SITES)-1)]
 
         rack = f"R{(leaf_id - 101) % 20 + 1:02d}"
         building = site.split('-')[0]
         hall = f"Hall-{((leaf_id - 101) // 20) + 1}"
 
-        records.append(f"LEAF{leaf_id:05d}SN,{rack},{building},{hall},{site},2023-01-15,Network-Ops")
+        writer.writerow([f"LEAF{leaf_id:05d}SN", rack, building, hall, site,
+                         "2023-01-15", "Network-Ops"])
+        record_count += 1
 
     # FEX serials
     for fex_serial_id in range(1000, 1000 + NUM_FEX):
         site_idx = (fex_serial_id - 1000) // (NUM_FEX // 5)
-        sites = ['NYC-DC1', 'NYC-DC2', 'SFO-DC1', 'CHI-DC1', 'DAL-DC1']
-        site = sites[min(site_idx, len(sites)-1)]
+        site = SITES[min(site_idx, len(SITES)-1)]
 
         rack = f"R{(fex_serial_id - 1000) % 20 + 1:02d}"
         building = site.split('-')[0]
         hall = f"Hall-{((fex_serial_id - 1000) // 20) + 1}"
 
-        records.append(f"FEX{fex_serial_id:06d}ABC,{rack},{building},{hall},{site},2023-03-20,Network-Ops")
+        writer.writerow([f"FEX{fex_serial_id:06d}ABC", rack, building, hall, site,
+                         "2023-03-20", "Network-Ops"])
+        record_count += 1
 
-    return "\n".join(records)
+    return record_count
 
 
 if __name__ == '__main__':
@@ -362,27 +365,75 @@ if __name__ == '__main__':
     print("="*70)
     print()
 
-    # Generate fabric data
-    fabric_data = generate_fabric()
-
-    # Save to file
-    output_file = '../data/samples/sample_large_scale.json'
-    print(f"\nSaving to {output_file}...")
-
-    with open(output_file, 'w') as f:
-        json.dump(fabric_data, f, indent=2)
+    print(f"Generating ACI fabric data:")
+    print(f"  - {NUM_LEAFS} leaf switches")
+    print(f"  - {NUM_FEX} FEX devices")
+    print(f"  - {NUM_TENANTS} tenants")
+    print(f"  - ~{NUM_TENANTS * NUM_VRFS_PER_TENANT * NUM_BDS_PER_VRF} bridge domains")
+    print(f"  - ~{NUM_TENANTS * NUM_VRFS_PER_TENANT * NUM_BDS_PER_VRF * NUM_EPGS_PER_BD} EPGs")
+    print()
 
-    print(f"[OK] Saved {len(fabric_data['imdata'])} objects")
+    fex_distribution = build_fex_distribution()
 
-    # Generate CMDB data
-    cmdb_data = generate_cmdb_data()
+    # Stream objects straight to disk: each generator yields one object at
+    # a time, so the full imdata list never materializes in memory and
+    # serialization overlaps generation.
+    output_file = '../data/samples/sample_large_scale.json'
+    print(f"Streaming to {output_file}...")
+
+    # Progress is reported at most ~once per second; the modulo check
+    # keeps the clock read itself off the per-object hot path
+    object_count = 0
+    type_prefixes = {}
+    last_progress = time.monotonic()
+    with open(output_file, 'wb') as f:
+        f.write(b'{"imdata":[')
+        for obj in chain(
+            iter_leafs(),
+            iter_fex(fex_distribution),
+            iter_tenants(fex_distribution, TENANT_NAMES),
+            iter_contracts(TENANT_NAMES),
+            iter_l3outs(TENANT_NAMES),
+        ):
+            if object_count:
+                f.write(b',')
+            if isinstance(obj, bytes):
+                # Hot object types yield preformatted JSON directly
+                f.write(obj)
+            else:
+                # (type, attributes) tuple: write the single-key wrapper
+                # as literal bytes so only the attributes dict is encoded
+                obj_type, attrs = obj
+                prefix = type_prefixes.get(obj_type)
+                if prefix is None:
+                    prefix = type_prefixes.setdefault(
+                        obj_type, f'{{"{obj_type}":{{"attributes":'.encode('ascii'))
+                f.write(prefix)
+                f.write(_dumps(attrs))
+                f.write(b'}}')
+            object_count += 1
+            if not object_count % 1024:
+                now = time.monotonic()
+                if now - last_progress >= 1.0:
+                    sys.stdout.write(f"  ... {object_count} objects\n")
+                    sys.stdout.flush()
+                    last_progress = now
+        f.write(b']}')
+
+    print(f"[OK] Saved {object_count} objects")
+
+    # Fabric generation state is no longer needed; only object_count
+    # survives into the summary below
+    del fex_distribution
+
+    # Generate CMDB data, streaming rows straight into the file
     cmdb_file = '../data/samples/sample_large_scale_cmdb.csv'
 
     print(f"\nSaving CMDB to {cmdb_file}...")
-    with open(cmdb_file, 'w') as f:
-        f.write(cmdb_data)
+    with open(cmdb_file, 'w', newline='') as f:
+        cmdb_count = generate_cmdb_data(f)
 
-    print(f"[OK] Saved {cmdb_data.count(chr(10))} CMDB records")
+    print(f"[OK] Saved {cmdb_count} CMDB records")
 
     print()
     print("="*70)
@@ -393,7 +444,7 @@ if __name__ == '__main__':
     print(f"  Leafs: {NUM_LEAFS}")
     print(f"  FEX: {NUM_FEX}")
     print(f"  Tenants: {NUM_TENANTS}")
-    print(f"  Total objects: {len(fabric_data['imdata'])}")
+    print(f"  Total objects: {object_count}")
     print()
     print("You can now upload these files:")
     print(f"  1. {output_file}")
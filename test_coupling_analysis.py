@@ -3,11 +3,28 @@
 Comprehensive Coupling Analysis Test
 Tests all coupling analysis methods with enterprise-scale data (1000+ EPGs).
 """
-import json
+import os
+import shutil
 import sys
 from pathlib import Path
-from analysis.engine import ACIAnalyzer
-from analysis.fabric_manager import FabricManager
+from analysis import engine
+from conftest import get_fabric_manager
+from testutils import dump_json
+
+def stage_sample(src, dst):
+    """Place a sample file at dst without re-copying it on every run.
+
+    The copy is skipped when dst already matches the source size, and a
+    hard link (no data copy) is used when the filesystem allows one.
+    """
+    src = Path(src)
+    if dst.exists() and dst.stat().st_size == src.stat().st_size:
+        return
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
 
 def print_section(title):
     """Print section header."""
@@ -19,21 +36,33 @@ def test_coupling_analysis():
     """Test comprehensive coupling analysis with enterprise data."""
     print_section("Enterprise-Scale Coupling Analysis Test")
 
+    # ACI_FAST_TEST swaps in the small sample fabric so the local
+    # iteration loop stays around a second; CI leaves the variable unset
+    # and keeps the full 1000-EPG path. The analyses all still run - the
+    # absolute numbers are just not meaningful at small scale.
+    fast_mode = bool(os.getenv('ACI_FAST_TEST'))
+    if fast_mode:
+        fabric_name = "coupling_smoke"
+        sample_json = "data/samples/sample_aci.json"
+        sample_cmdb = "data/samples/sample_cmdb.csv"
+        print("\n   (ACI_FAST_TEST set: using the small smoke-test sample)")
+    else:
+        fabric_name = "enterprise_1000epg"
+        sample_json = "data/samples/sample_enterprise_1000epg.json"
+        sample_cmdb = "data/samples/sample_enterprise_1000epg_cmdb.csv"
+
     # Setup test fabric with enterprise data
     print("\n1. Setting up enterprise fabric...")
-    fabric_dir = Path("fabrics/enterprise_1000epg")
+    fabric_dir = Path("fabrics") / fabric_name
     fabric_dir.mkdir(parents=True, exist_ok=True)
 
     # Copy enterprise data
-    import shutil
-    shutil.copy("data/samples/sample_enterprise_1000epg.json",
-                fabric_dir / "aci_data.json")
-    shutil.copy("data/samples/sample_enterprise_1000epg_cmdb.csv",
-                fabric_dir / "cmdb_data.csv")
+    stage_sample(sample_json, fabric_dir / "aci_data.json")
+    stage_sample(sample_cmdb, fabric_dir / "cmdb_data.csv")
 
     # Create fabric index
-    fm = FabricManager(Path("fabrics"))
-    fabric_data = fm.get_fabric_data("enterprise_1000epg")
+    fm = get_fabric_manager()
+    fabric_data = fm.get_fabric_data(fabric_name)
     if not fabric_data.get('datasets'):
         fabric_data = {
             'created': '2025-11-10T16:00:00',
@@ -60,7 +89,7 @@ def test_coupling_analysis():
 
     # Initialize analyzer
     print("\n2. Initializing ACI Analyzer with enterprise data...")
-    analyzer = ACIAnalyzer(fabric_data)
+    analyzer = engine.get_analyzer(fabric_data)
     print("   [OK] Analyzer initialized")
 
     # Test 1: Coupling Issues Analysis
@@ -80,19 +109,22 @@ def test_coupling_analysis():
     print(f"      Cross-Tenant Contracts:   {stats['cross_tenant_contracts']}")
     print(f"      Migration Risk Score:     {coupling['migration_risk_score']}/100")
 
-    # Show top coupling issues
-    print(f"\n   Top 10 Coupling Issues:")
+    # Show top coupling issues; build the report once and write it with a
+    # single print instead of taking the stdout lock per line
+    lines = [f"\n   Top 10 Coupling Issues:"]
     for i, issue in enumerate(coupling['issues'][:10], 1):
-        print(f"      {i}. [{issue['severity'].upper()}] {issue['issue_type']}: {issue['description']}")
+        lines.append(f"      {i}. [{issue['severity'].upper()}] {issue['issue_type']}: {issue['description']}")
         if 'epg' in issue and issue['issue_type'] != 'cross_tenant_contracts':
-            print(f"         EPG: {issue['epg']}")
-            print(f"         Impact: {issue['migration_impact']}")
+            lines.append(f"         EPG: {issue['epg']}")
+            lines.append(f"         Impact: {issue['migration_impact']}")
+    print('\n'.join(lines))
 
     # High density devices
     if coupling['high_density_devices']:
-        print(f"\n   High Density Devices (>10 EPGs):")
-        for i, device in enumerate(coupling['high_density_devices'][:5], 1):
-            print(f"      {i}. {device['device']}: {device['epg_count']} EPGs, {device['vlan_count']} VLANs")
+        print('\n'.join(
+            [f"\n   High Density Devices (>10 EPGs):"] +
+            [f"      {i}. {device['device']}: {device['epg_count']} EPGs, {device['vlan_count']} VLANs"
+             for i, device in enumerate(coupling['high_density_devices'][:5], 1)]))
 
     # Test 2: Migration Waves Analysis
     print_section("Test 2: Migration Waves Analysis")
@@ -104,23 +136,25 @@ def test_coupling_analysis():
     print(f"      Total EPGs:               {waves['total_epgs']}")
     print(f"      Total Effort:             {waves['total_effort_hours']} hours ({waves['total_effort_days']} days)")
 
-    print(f"\n   Wave Breakdown:")
+    lines = [f"\n   Wave Breakdown:"]
     for wave_summary in waves['summary']:
-        print(f"\n      {wave_summary['wave']}:")
-        print(f"         EPG Count:            {wave_summary['epg_count']}")
-        print(f"         Estimated Hours:      {wave_summary['estimated_hours']}")
-        print(f"         Estimated Days:       {wave_summary['estimated_days']}")
-        print(f"         Description:          {wave_summary['description']}")
+        lines.append(f"\n      {wave_summary['wave']}:")
+        lines.append(f"         EPG Count:            {wave_summary['epg_count']}")
+        lines.append(f"         Estimated Hours:      {wave_summary['estimated_hours']}")
+        lines.append(f"         Estimated Days:       {wave_summary['estimated_days']}")
+        lines.append(f"         Description:          {wave_summary['description']}")
+    print('\n'.join(lines))
 
     # Show sample EPGs from each wave
-    print(f"\n   Sample EPGs by Wave:")
+    lines = [f"\n   Sample EPGs by Wave:"]
     for wave_name in ['wave1_standalone', 'wave2_low_coupling', 'wave3_medium_coupling', 'wave4_high_coupling']:
         epgs = waves['waves'][wave_name]
         if epgs:
-            print(f"\n      {wave_name.replace('_', ' ').title()} (sample of {min(3, len(epgs))} out of {len(epgs)}):")
+            lines.append(f"\n      {wave_name.replace('_', ' ').title()} (sample of {min(3, len(epgs))} out of {len(epgs)}):")
             for epg in epgs[:3]:
-                print(f"         - {epg['epg']} ({epg['tenant']})")
-                print(f"           Devices: {epg['device_count']}, Paths: {epg['path_count']}, Issues: {epg['issues']}")
+                lines.append(f"         - {epg['epg']} ({epg['tenant']})")
+                lines.append(f"           Devices: {epg['device_count']}, Paths: {epg['path_count']}, Issues: {epg['issues']}")
+    print('\n'.join(lines))
 
     # Test 3: VLAN Sharing Analysis
     print_section("Test 3: VLAN Sharing Analysis")
@@ -136,14 +170,15 @@ def test_coupling_analysis():
     print(f"      Multi-Device VLANs:       {vlan_stats['multi_device_vlans']}")
 
     # Show top VLAN sharing issues
-    print(f"\n   Top 10 VLAN Sharing Issues:")
+    lines = [f"\n   Top 10 VLAN Sharing Issues:"]
     for i, issue in enumerate(vlan_analysis['sharing_issues'][:10], 1):
-        print(f"      {i}. VLAN {issue['vlan']} [{issue['severity'].upper()}]")
-        print(f"         EPG Count:            {issue['epg_count']}")
-        print(f"         Device Count:         {issue['device_count']}")
-        print(f"         Tenant Count:         {issue['tenant_count']}")
-        print(f"         Sample EPGs:          {', '.join(issue['epgs'][:3])}")
-        print(f"         Migration Risk:       {issue['migration_risk']}")
+        lines.append(f"      {i}. VLAN {issue['vlan']} [{issue['severity'].upper()}]")
+        lines.append(f"         EPG Count:            {issue['epg_count']}")
+        lines.append(f"         Device Count:         {issue['device_count']}")
+        lines.append(f"         Tenant Count:         {issue['tenant_count']}")
+        lines.append(f"         Sample EPGs:          {', '.join(issue['epgs'][:3])}")
+        lines.append(f"         Migration Risk:       {issue['migration_risk']}")
+    print('\n'.join(lines))
 
     # Test 4: Overall Risk Assessment
     print_section("Test 4: Migration Risk Assessment")
@@ -189,9 +224,10 @@ def test_coupling_analysis():
     print(f"      - Focus on multi-device EPGs first")
     print(f"      - Consider L2 extension or simultaneous migration")
 
-    print(f"\n   4. Progressive Wave Migration")
-    for i, wave_summary in enumerate(waves['summary'][1:], 2):
-        print(f"      - Wave {i}: {wave_summary['epg_count']} EPGs ({wave_summary['estimated_days']} days)")
+    print('\n'.join(
+        [f"\n   4. Progressive Wave Migration"] +
+        [f"      - Wave {i}: {wave_summary['epg_count']} EPGs ({wave_summary['estimated_days']} days)"
+         for i, wave_summary in enumerate(waves['summary'][1:], 2)]))
 
     print(f"\n   5. Cross-Tenant Contract Dependencies")
     if stats['cross_tenant_contracts'] > 0:
@@ -220,8 +256,7 @@ def test_coupling_analysis():
     }
 
     output_file = output_dir / "coupling_analysis_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    dump_json(output_file, results, pretty='--pretty' in sys.argv)
 
     print(f"\n   [OK] Results saved to: {output_file}")
     print(f"   File size: {output_file.stat().st_size / 1024:.2f} KB")
@@ -241,6 +276,9 @@ def test_coupling_analysis():
     return True
 
 if __name__ == '__main__':
+    # Block-buffer stdout so the report is flushed in large chunks rather
+    # than per line when attached to a terminal
+    sys.stdout.reconfigure(line_buffering=False)
     try:
         success = test_coupling_analysis()
         sys.exit(0 if success else 1)
@@ -3,14 +3,42 @@
 Test dashboard integration with real data to ensure visualization works.
 """
 
+import re
 import sys
+from collections import Counter
 import json
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app import app
-from analysis import fabric_manager, engine
+from conftest import cached_get, get_client, get_fabric_manager
+
+# orjson parses the sample JSON several times faster than stdlib json;
+# fall back silently when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Every literal the page checks look for, compiled into one pattern so a
+# single pass over the body finds them all. The lookahead makes matches
+# overlap-safe ('tab' is still reported inside 'dashboard-tabs') and the
+# longest-first ordering keeps the alternation deterministic.
+PAGE_NEEDLES = (
+    b'chart.js', b'd3js.org', b'd3.v7', b'dashboard-tabs', b'tab',
+    b'dashboards.js', b'viz-data', b'vizdata',
+    b'upload.js', b'drop-zone', b'drag', b'dataset',
+)
+_NEEDLE_SCAN = re.compile(
+    b'(?=(' + b'|'.join(
+        re.escape(n) for n in sorted(PAGE_NEEDLES, key=len, reverse=True)
+    ) + b'))')
+
+
+def find_needles(body_lower):
+    """Return the set of PAGE_NEEDLES present, found in one scan."""
+    return set(_NEEDLE_SCAN.findall(body_lower))
+
 
 def test_dashboard_with_data():
     """Test dashboard rendering with actual fabric data."""
@@ -18,43 +46,42 @@ def test_dashboard_with_data():
     print("TESTING DASHBOARD INTEGRATION")
     print("="*70)
 
-    # Create test client
-    client = app.test_client()
-    app.config['TESTING'] = True
+    # Shared, pre-configured test client
+    client = get_client()
 
-    # Initialize fabric manager
-    fm = fabric_manager.FabricManager('fabrics')
+    # Initialize fabric manager (shared with the other test modules)
+    fm = get_fabric_manager()
 
     # Check if test fabric exists
-    fabrics = fm.list_fabrics()
-    test_fabric = None
-
-    for f in fabrics:
-        if f['name'] == 'test_fabric':
-            test_fabric = f
-            break
+    test_fabric = fm.get_fabric('test_fabric')
 
     if not test_fabric:
         print("\nNo test_fabric found. Creating one with sample data...")
         try:
-            fm.create_fabric('test_fabric')
-
-            # Load sample data
-            sample_file = Path('data/samples/sample_aci.json')
-            if sample_file.exists():
-                with open(sample_file, 'r') as f:
-                    objects = json.load(f)
-
-                fm.add_dataset('test_fabric', {
-                    'type': 'aci_json',
-                    'name': 'sample_aci.json',
-                    'objects': objects,
-                    'path': str(sample_file)
-                })
-                print(f"   Created test_fabric with {len(objects)} objects")
-            else:
-                print(f"   ERROR: Sample file not found: {sample_file}")
-                return False
+            # One transaction batches the create + add_dataset index
+            # mutations into a single read and atomic rewrite
+            with fm.transaction():
+                fm.create_fabric('test_fabric')
+
+                # Load sample data
+                sample_file = Path('data/samples/sample_aci.json')
+                if sample_file.exists():
+                    content = sample_file.read_bytes()
+                    if orjson is not None:
+                        objects = orjson.loads(content)
+                    else:
+                        objects = json.loads(content)
+
+                    fm.add_dataset('test_fabric', {
+                        'type': 'aci_json',
+                        'name': 'sample_aci.json',
+                        'objects': objects,
+                        'path': str(sample_file)
+                    })
+                    print(f"   Created test_fabric with {len(objects)} objects")
+                else:
+                    print(f"   ERROR: Sample file not found: {sample_file}")
+                    return False
         except Exception as e:
             print(f"   ERROR creating test fabric: {e}")
             return False
@@ -71,20 +98,22 @@ def test_dashboard_with_data():
     # Test visualize page
     print("\n2. Testing visualize page with data...")
     try:
-        response = client.get('/visualize')
+        response = cached_get('/visualize')
         status = 'PASS' if response.status_code == 200 else 'FAIL'
         error = None if status == 'PASS' else f'Status code: {response.status_code}'
 
-        # Check if required elements are in response
+        # Check if required elements are in response. The checks only look
+        # for ASCII needles, so scan the raw bytes and skip the UTF-8
+        # decode of the rendered page entirely
         if status == 'PASS':
-            html = response.data.decode('utf-8')
+            found = find_needles(response.data.lower())
 
             checks = [
-                ('Chart.js CDN', 'chart.js' in html.lower()),
-                ('D3.js CDN', 'd3js.org' in html or 'd3.v7' in html),
-                ('Dashboard tabs', 'dashboard-tabs' in html or 'tab' in html.lower()),
-                ('Dashboards JS', 'dashboards.js' in html),
-                ('Visualization data', 'viz-data' in html or 'vizData' in html),
+                ('Chart.js CDN', b'chart.js' in found),
+                ('D3.js CDN', b'd3js.org' in found or b'd3.v7' in found),
+                ('Dashboard tabs', b'dashboard-tabs' in found or b'tab' in found),
+                ('Dashboards JS', b'dashboards.js' in found),
+                ('Visualization data', b'viz-data' in found or b'vizdata' in found),
             ]
 
             for check_name, check_result in checks:
@@ -114,17 +143,17 @@ def test_dashboard_with_data():
     # Test analyze page
     print("\n3. Testing analyze page with data...")
     try:
-        response = client.get('/analyze')
+        response = cached_get('/analyze')
         status = 'PASS' if response.status_code == 200 else 'FAIL'
         error = None if status == 'PASS' else f'Status code: {response.status_code}'
 
         if status == 'PASS':
-            html = response.data.decode('utf-8')
+            found = find_needles(response.data.lower())
 
             checks = [
-                ('Upload JS', 'upload.js' in html),
-                ('Drop zone', 'drop-zone' in html or 'drag' in html.lower()),
-                ('Dataset list', 'dataset' in html.lower()),
+                ('Upload JS', b'upload.js' in found),
+                ('Drop zone', b'drop-zone' in found or b'drag' in found),
+                ('Dataset list', b'dataset' in found),
             ]
 
             for check_name, check_result in checks:
@@ -150,7 +179,7 @@ def test_dashboard_with_data():
     # Test API endpoint
     print("\n4. Testing analysis API endpoint...")
     try:
-        response = client.get('/api/analysis/port_utilization')
+        response = cached_get('/api/analysis/port_utilization')
         status = 'PASS' if response.status_code == 200 else 'FAIL'
 
         if status == 'PASS':
@@ -184,9 +213,10 @@ def test_dashboard_with_data():
     print("SUMMARY")
     print("="*70)
 
-    passed = sum(1 for t in tests if t['status'] == 'PASS')
-    warned = sum(1 for t in tests if t['status'] == 'WARN')
-    failed = sum(1 for t in tests if t['status'] == 'FAIL')
+    status_counts = Counter(t['status'] for t in tests)
+    passed = status_counts['PASS']
+    warned = status_counts['WARN']
+    failed = status_counts['FAIL']
 
     print(f"\nTotal tests: {len(tests)}")
     print(f"  PASSED: {passed}")
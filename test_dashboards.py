@@ -3,26 +3,43 @@
 Test script for dashboard visualization data generation.
 Tests the analysis engine without Flask session/CSRF.
 """
-import json
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from analysis.engine import ACIAnalyzer
-from analysis.parsers import parse_aci_json
-from analysis.fabric_manager import FabricManager
+from testutils import dump_json, to_soa
+
+# Single source of truth for the dashboard analyses; each entry names the
+# analyzer's analyze_<name> method and the key it lands under
+METHODS = (
+    'port_utilization',
+    'leaf_fex_mapping',
+    'vlan_distribution',
+    'epg_complexity',
+    'migration_flags',
+    'vpc_symmetry',
+    'bd_epg_mapping',
+    'contract_scope',
+    'cmdb_correlation',
+)
 
 def test_dashboard_data():
     """Test dashboard data generation with sample large-scale data."""
+    # Imported lazily so importing this module stays cheap; the shared
+    # accessors only load the analysis package when the test runs
+    from conftest import get_analyzer, get_fabric_manager
+
     print("=" * 70)
     print("Dashboard Visualization Data Test")
     print("=" * 70)
 
     # Initialize fabric manager
     print("\n1. Initializing Fabric Manager...")
-    fm = FabricManager(Path("fabrics"))
+    fm = get_fabric_manager()
     print("   [OK] Fabric manager initialized")
 
     # Get fabric data
@@ -37,34 +54,30 @@ def test_dashboard_data():
 
     # Initialize analyzer
     print("\n3. Initializing ACI Analyzer...")
-    analyzer = ACIAnalyzer(fabric_data)
+    analyzer = get_analyzer("test_fabric")
     print("   [OK] Analyzer initialized")
 
     # Run all analysis methods
     print("\n4. Running Analysis Methods:")
     print("-" * 70)
 
-    analyses = {
-        'port_utilization': analyzer.analyze_port_utilization(),
-        'leaf_fex_mapping': analyzer.analyze_leaf_fex_mapping(),
-        'vlan_distribution': analyzer.analyze_vlan_distribution(),
-        'epg_complexity': analyzer.analyze_epg_complexity(),
-        'migration_flags': analyzer.analyze_migration_flags(),
-        'vpc_symmetry': analyzer.analyze_vpc_symmetry(),
-        'bd_epg_mapping': analyzer.analyze_bd_epg_mapping(),
-        'contract_scope': analyzer.analyze_contract_scope(),
-        'cmdb_correlation': analyzer.analyze_cmdb_correlation()
-    }
+    # The analyses are independent, so dispatch the METHODS table on a
+    # thread pool and gather the results back in table order
+    with ThreadPoolExecutor(max_workers=len(METHODS)) as pool:
+        futures = {name: pool.submit(getattr(analyzer, f'analyze_{name}'))
+                   for name in METHODS}
+        analyses = {name: future.result() for name, future in futures.items()}
 
+    # Build the per-analysis report once and write it with a single print
+    lines = []
     for name, result in analyses.items():
         if isinstance(result, dict):
-            data_size = len(result)
-            print(f"   [OK] {name:30s} {data_size} keys")
+            lines.append(f"   [OK] {name:30s} {len(result)} keys")
         elif isinstance(result, list):
-            data_size = len(result)
-            print(f"   [OK] {name:30s} {data_size} items")
+            lines.append(f"   [OK] {name:30s} {len(result)} items")
         else:
-            print(f"   [OK] {name:30s} OK")
+            lines.append(f"   [OK] {name:30s} OK")
+    print('\n'.join(lines))
 
     # Generate visualization data structure
     print("\n5. Generating Dashboard Visualization Data:")
@@ -85,8 +98,12 @@ def test_dashboard_data():
     # Calculate statistics
     port_util = analyses['port_utilization']
     if port_util:
-        avg_util = sum(p['utilization_pct'] for p in port_util) / len(port_util)
-        consolidation_candidates = sum(1 for p in port_util if p['consolidation_score'] >= 60)
+        # Pivot the columns of interest to struct-of-arrays once, then run
+        # the stats as vectorized array ops
+        port_cols = to_soa(port_util, ('utilization_pct', 'consolidation_score'))
+        avg_util = float(port_cols['utilization_pct'].mean())
+        consolidation_candidates = int(
+            (port_cols['consolidation_score'] >= 60).sum())
     else:
         avg_util = 0
         consolidation_candidates = 0
@@ -112,11 +129,10 @@ def test_dashboard_data():
     required_keys = ['topology', 'port_utilization', 'vlan_distribution',
                      'epg_complexity', 'migration_flags', 'statistics']
 
-    for key in required_keys:
-        if key in viz_data:
-            print(f"   [OK] {key:30s} present")
-        else:
-            print(f"   [X] {key:30s} MISSING")
+    print('\n'.join(
+        f"   [OK] {key:30s} present" if key in viz_data
+        else f"   [X] {key:30s} MISSING"
+        for key in required_keys))
 
     # Check topology structure
     topo = viz_data['topology']
@@ -153,12 +169,10 @@ def test_dashboard_data():
         print(f"\n   EPG Complexity:")
         print(f"     Total EPGs: {len(epg_complex)}")
         if epg_complex:
-            complexity_levels = {}
-            for epg in epg_complex:
-                level = epg.get('complexity_level', 'unknown')
-                complexity_levels[level] = complexity_levels.get(level, 0) + 1
-            for level, count in complexity_levels.items():
-                print(f"     {level.capitalize()}: {count}")
+            complexity_levels = Counter(
+                epg.get('complexity_level', 'unknown') for epg in epg_complex)
+            print('\n'.join(f"     {level.capitalize()}: {count}"
+                             for level, count in complexity_levels.items()))
 
     # Check migration flags
     migration_flags = analyses['migration_flags']
@@ -166,12 +180,10 @@ def test_dashboard_data():
         print(f"\n   Migration Readiness:")
         print(f"     Total flags: {len(migration_flags)}")
         if migration_flags:
-            severity_counts = {}
-            for flag in migration_flags:
-                severity = flag.get('severity', 'unknown')
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
-            for severity, count in severity_counts.items():
-                print(f"     {severity.capitalize()}: {count}")
+            severity_counts = Counter(
+                flag.get('severity', 'unknown') for flag in migration_flags)
+            print('\n'.join(f"     {severity.capitalize()}: {count}"
+                             for severity, count in severity_counts.items()))
 
     print("\n" + "=" * 70)
     print("Dashboard Data Test: PASSED [OK]")
@@ -180,13 +192,13 @@ def test_dashboard_data():
     # Save sample output for inspection
     output_file = Path("output/dashboard_test_data.json")
     output_file.parent.mkdir(exist_ok=True)
-    with open(output_file, 'w') as f:
-        json.dump(viz_data, f, indent=2, default=str)
+    dump_json(output_file, viz_data, pretty='--pretty' in sys.argv)
     print(f"\nSample data saved to: {output_file}")
 
     return True
 
 if __name__ == '__main__':
+    sys.stdout.reconfigure(line_buffering=False)
     try:
         success = test_dashboard_data()
         sys.exit(0 if success else 1)
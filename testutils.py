@@ -0,0 +1,42 @@
+"""Shared helpers for the script-style test suite."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+# orjson serializes large result trees several times faster than stdlib
+# json; fall back silently when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def to_soa(rows, fields):
+    """Convert a list of dicts into a dict of parallel numpy arrays.
+
+    The analyzer returns array-of-structs results (one dict per row);
+    pivoting the columns of interest into struct-of-arrays form once lets
+    the tests run stats and filters as vectorized array ops instead of
+    repeated per-row generator scans.
+    """
+    return {field: np.array([row[field] for row in rows]) for field in fields}
+
+
+def dump_json(path, obj, pretty=False):
+    """Serialize obj to path as JSON, compact by default.
+
+    Compact output is ~half the bytes and serialization work of
+    indent=2; pass pretty=True (the scripts map this to a --pretty flag)
+    when a human actually needs to read the file.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        data = orjson.dumps(obj, default=str, option=option)
+    elif pretty:
+        data = json.dumps(obj, indent=2, default=str).encode('utf-8')
+    else:
+        data = json.dumps(obj, separators=(',', ':'),
+                          default=str).encode('utf-8')
+    Path(path).write_bytes(data)